@@ -48,24 +48,32 @@ def run_heuristic_analysis(sch, net_build, detected) -> Dict[str, Any]:
     circuit_type = "unknown"
     main_ic = None
     critical_components: List[str] = []
+    seen_components: set[str] = set()
 
     for sym in sch.symbols:
         if '?' in sym.ref:
             continue
 
-        if sym.ref.startswith('U'):
+        kind = sym.ref[:1]
+        if kind == 'U':
             main_ic = sym.ref
-            critical_components.append(sym.ref)
+            if sym.ref not in seen_components:
+                seen_components.add(sym.ref)
+                critical_components.append(sym.ref)
 
-            if '555' in sym.lib_id.lower():
+            lib_id = sym.lib_id.lower()
+            if '555' in lib_id:
                 circuit_type = "555_timer_astable"
-            elif any(kw in sym.lib_id.lower() for kw in ['stm32', 'esp32', 'atmega', 'attiny', 'nrf', 'rp2040']):
+            elif any(kw in lib_id for kw in ['stm32', 'esp32', 'atmega', 'attiny', 'nrf', 'rp2040']):
                 circuit_type = "microcontroller_basic"
 
         if circuit_type == "555_timer_astable":
-            if sym.ref.startswith('R') or sym.ref.startswith('C'):
+            if (kind == 'R' or kind == 'C') and sym.ref not in seen_components:
+                seen_components.add(sym.ref)
                 critical_components.append(sym.ref)
 
+    critical_components.sort()
+
     analysis_pipeline: List[Dict[str, Any]] = []
 
     analysis_pipeline = []
@@ -74,7 +82,7 @@ def run_heuristic_analysis(sch, net_build, detected) -> Dict[str, Any]:
     if detected.mcu_symbols:
         main_ic = detected.mcu_symbols[0]
     else:
-        u_comps = sorted([s.ref for s in sch.symbols if s.ref.upper().startswith('U')])
+        u_comps = sorted([s.ref for s in sch.symbols if s.ref[:1].upper() == 'U'])
         if u_comps:
              main_ic = u_comps[0]
              
@@ -215,7 +223,7 @@ def run_heuristic_analysis(sch, net_build, detected) -> Dict[str, Any]:
             "purpose": "Generate output based on components detected",
             "confidence": 0.6,
             "main_ic": main_ic,
-            "critical_components": sorted(set(critical_components)),
+            "critical_components": critical_components,
         },
         "analysis": analysis_pipeline,
         "expected_behavior": {
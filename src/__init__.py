@@ -1,17 +1,39 @@
 """
 Backend analysis modules for KiCad Bring-Up Assistant
 """
+import importlib
 
-# Core parsing and extraction
-from .parse_sexp import parse_kicad_sch
-from .kicad_extract import parse_schematic
-from .netlist_build import build_nets
-from .indicators import run_detectors
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562) so importing `src.<module>` directly doesn't pull
+# in the LLM SDK setup and every other backend module.
+_LAZY_EXPORTS = {
+    # Core parsing and extraction
+    'parse_kicad_sch': 'parse_sexp',
+    'parse_schematic': 'kicad_extract',
+    'build_nets': 'netlist_build',
+    'run_detectors': 'indicators',
+
+    # Analysis and reporting
+    'generate_schematic_summary': 'schematic_summary',
+    'LLMAnalyzer': 'llm_analysis',
+    'LLMProvider': 'llm_analysis',
+    'export_checklist_markdown': 'export',
+    'export_checklist_json': 'export',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
-# Analysis and reporting
-from .schematic_summary import generate_schematic_summary
-from .llm_analysis import LLMAnalyzer, LLMProvider
-from .export import export_checklist_markdown, export_checklist_json
 
 # Make key functions available at package level
 __all__ = [
@@ -26,4 +48,4 @@ __all__ = [
     'export_checklist_json',
 ]
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
@@ -3,84 +3,133 @@
 Analysis function registry - COMPLETE & CORRECTED
 """
 from __future__ import annotations
-from typing import Dict, Any, Callable
-from .power_analysis import (
-    verify_power_connectivity,
-    check_power_rail_routing,
-    analyze_decoupling_capacitors,
-    verify_voltage_regulator_circuit,
-    check_power_sequencing,
-    detect_multi_voltage_system, 
-    AnalysisResult
-)
-from .timing_analysis import (
-    analyze_rc_timing_network,
-    verify_crystal_circuit,
-    check_clock_distribution,
-)
-from .signal_analysis import (
-    check_floating_pins,
-    verify_pull_up_pull_down,
-    trace_signal_path,
-    verify_ground_plane,
-    check_differential_pairs,
-    analyze_signal_termination,
-    verify_i2c_bus, 
-)
-from .mcu_analysis import (
-    verify_mcu_boot_configuration,
-    check_debug_interface,
-    analyze_reset_circuit,
-    verify_programming_interface,
-    check_mcu_power_pins,
-)
-
-# Import enhanced versions if available
-try:
-    from .mcu_analysis_enhanced import check_boot_pins
-except ImportError:
-    # Fallback to alias
-    check_boot_pins = verify_mcu_boot_configuration
+import copy
+import functools
+import importlib
+from collections.abc import Mapping
+from typing import Dict, Any, Callable, Iterator, Tuple
+from .types import AnalysisResult, SEV_LOW, STATUS_ERROR
 
 
 # Function registry - COMPLETE LIST
-ANALYSIS_FUNCTIONS: Dict[str, Callable] = {
+# name -> (submodule, attribute). Submodules are only imported when one of
+# their functions is actually looked up.
+_FUNCTION_SOURCES: Dict[str, Tuple[str, str]] = {
     # Power analysis
-    "verify_power_connectivity": verify_power_connectivity,
-    "check_power_rail_routing": check_power_rail_routing,
-    "analyze_decoupling_capacitors": analyze_decoupling_capacitors,
-    "verify_voltage_regulator_circuit": verify_voltage_regulator_circuit,
-    "check_power_sequencing": check_power_sequencing,
-    "detect_multi_voltage_system": detect_multi_voltage_system, 
-    
+    "verify_power_connectivity": ("power_analysis", "verify_power_connectivity"),
+    "check_power_rail_routing": ("power_analysis", "check_power_rail_routing"),
+    "analyze_decoupling_capacitors": ("power_analysis", "analyze_decoupling_capacitors"),
+    "verify_voltage_regulator_circuit": ("power_analysis", "verify_voltage_regulator_circuit"),
+    "check_power_sequencing": ("power_analysis", "check_power_sequencing"),
+    "detect_multi_voltage_system": ("power_analysis", "detect_multi_voltage_system"),
+
     # Timing/clock analysis
-    "analyze_rc_timing_network": analyze_rc_timing_network,
-    "verify_crystal_circuit": verify_crystal_circuit,
-    "check_clock_distribution": check_clock_distribution,
-    
+    "analyze_rc_timing_network": ("timing_analysis", "analyze_rc_timing_network"),
+    "verify_crystal_circuit": ("timing_analysis", "verify_crystal_circuit"),
+    "check_clock_distribution": ("timing_analysis", "check_clock_distribution"),
+
     # Signal integrity
-    "check_floating_pins": check_floating_pins,
-    "verify_pull_up_pull_down": verify_pull_up_pull_down,
-    "trace_signal_path": trace_signal_path,
-    "verify_ground_plane": verify_ground_plane,
-    "check_differential_pairs": check_differential_pairs,
-    "analyze_signal_termination": analyze_signal_termination,
-    "verify_i2c_bus": verify_i2c_bus, 
-    
+    "check_floating_pins": ("signal_analysis", "check_floating_pins"),
+    "verify_pull_up_pull_down": ("signal_analysis", "verify_pull_up_pull_down"),
+    "trace_signal_path": ("signal_analysis", "trace_signal_path"),
+    "verify_ground_plane": ("signal_analysis", "verify_ground_plane"),
+    "check_differential_pairs": ("signal_analysis", "check_differential_pairs"),
+    "analyze_signal_termination": ("signal_analysis", "analyze_signal_termination"),
+    "verify_i2c_bus": ("signal_analysis", "verify_i2c_bus"),
+
     # MCU specific
-    "verify_mcu_boot_configuration": verify_mcu_boot_configuration,
-    "check_boot_pins": check_boot_pins,
-    "check_debug_interface": check_debug_interface,
-    "analyze_reset_circuit": analyze_reset_circuit,
-    "verify_programming_interface": verify_programming_interface,
-    "check_mcu_power_pins": check_mcu_power_pins,
-    
+    "verify_mcu_boot_configuration": ("mcu_analysis", "verify_mcu_boot_configuration"),
+    "check_boot_pins": ("mcu_analysis", "check_boot_pins"),
+    "check_debug_interface": ("mcu_analysis", "check_debug_interface"),
+    "analyze_reset_circuit": ("mcu_analysis", "analyze_reset_circuit"),
+    "verify_programming_interface": ("mcu_analysis", "verify_programming_interface"),
+    "check_mcu_power_pins": ("mcu_analysis", "check_mcu_power_pins"),
+
     # Aliases for LLM compatibility
-    "check_decoupling_caps": analyze_decoupling_capacitors,  
-    "check_mcu_boot_pins": verify_mcu_boot_configuration,   
+    "check_decoupling_caps": ("power_analysis", "analyze_decoupling_capacitors"),
+    "check_mcu_boot_pins": ("mcu_analysis", "verify_mcu_boot_configuration"),
 }
 
 
+@functools.cache
+def _resolve(name: str) -> Callable:
+    """Import the submodule providing `name` and return the function (KeyError if unknown)"""
+    module_name, attr = _FUNCTION_SOURCES[name]
+    return getattr(importlib.import_module(f".{module_name}", __package__), attr)
+
+
+class _LazyFunctionRegistry(Mapping):
+    """Read-only name -> function view over _FUNCTION_SOURCES, kept for callers of ANALYSIS_FUNCTIONS"""
+
+    def __getitem__(self, name: str) -> Callable:
+        return _resolve(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in _FUNCTION_SOURCES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FUNCTION_SOURCES)
+
+    def __len__(self) -> int:
+        return len(_FUNCTION_SOURCES)
+
+
+ANALYSIS_FUNCTIONS: Mapping[str, Callable] = _LazyFunctionRegistry()
+
+
+_UNKNOWN_FUNCTION_RECOMMENDATIONS = ("Check function name spelling", "Verify function is registered")
+_CRASHED_FUNCTION_RECOMMENDATIONS = ("Check function parameters", "Review error details")
+
+
+def _error_result(function_name: str, summary: str, details: Dict[str, Any],
+                  issue: str, recommendations: Tuple[str, ...]) -> AnalysisResult:
+    """Build the low-severity "error" result returned for unknown/crashed functions"""
+    return AnalysisResult(
+        function_name=function_name,
+        status=STATUS_ERROR,
+        summary=summary,
+        details=details,
+        issues=[issue],
+        recommendations=list(recommendations),
+        severity=SEV_LOW,
+        prevents_bringup=False
+    )
+
+
+def _detached(result: AnalysisResult) -> AnalysisResult:
+    """Deep copy of `result`, so nested details (per-net/per-IC dicts) aren't shared either"""
+    return copy.deepcopy(result)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _params_key(obj: Any) -> Any:
+    """
+    Hashable memo key for plain-JSON params (dict with str keys, list, str,
+    int, float, bool, None). Keeps value types, so [1] / (1,) / ["1"] / [True]
+    all differ; anything else raises TypeError and isn't memoized.
+    """
+    kind = type(obj)
+    if kind in _JSON_SCALARS:
+        return (kind, obj)
+    if kind is list:
+        return (list, tuple(_params_key(v) for v in obj))
+    if kind is dict:
+        if not all(type(k) is str for k in obj):
+            raise TypeError("non-string params key")
+        return (dict, tuple(sorted((k, _params_key(v)) for k, v in obj.items())))
+    raise TypeError(f"unsupported params value: {kind.__name__}")
+
+
+def _result_cache(sch, net_build) -> Dict[Tuple[Callable, Any], Any]:
+    """Memo of successful results for this (sch, net_build) pair, stored on net_build"""
+    cache = getattr(net_build, "_analysis_cache", None)
+    if cache is None or cache[0] is not sch:
+        cache = net_build._analysis_cache = (sch, {})
+    return cache[1]
+
+
 def execute_analysis_function(
     function_name: str,
     params: Dict[str, Any],
@@ -88,39 +137,47 @@ def execute_analysis_function(
     net_build
 ) -> AnalysisResult:
     """Execute analysis function by name"""
-    if function_name not in ANALYSIS_FUNCTIONS:
-        return AnalysisResult(
-            function_name=function_name,
-            status="error",
-            summary=f"Unknown analysis function: {function_name}",
-            details={"error": "Function not found in registry"},
-            issues=[f"Function '{function_name}' is not implemented"],
-            recommendations=["Check function name spelling", "Verify function is registered"],
-            severity="low",
-            prevents_bringup=False
+    if function_name not in _FUNCTION_SOURCES:
+        return _error_result(
+            function_name,
+            f"Unknown analysis function: {function_name}",
+            {"error": "Function not found in registry"},
+            f"Function '{function_name}' is not implemented",
+            _UNKNOWN_FUNCTION_RECOMMENDATIONS
         )
-    
-    func = ANALYSIS_FUNCTIONS[function_name]
-    
+
+    func = _resolve(function_name)
+
+    # Analysis functions are pure, so repeated calls (including via an alias)
+    # with the same params on the same schematic reuse the earlier result.
+    try:
+        key = (func, _params_key(params))
+    except TypeError:
+        key = None
+    cache = _result_cache(sch, net_build)
+    # Callers get their own containers, so mutating a returned result
+    # (e.g. appending to a report list) can't leak into the cached one.
+    if key is not None and key in cache:
+        return _detached(cache[key])
+
     try:
         result = func(params, sch, net_build)
+        if key is not None:
+            cache[key] = _detached(result)
         return result
     except Exception as e:
-        return AnalysisResult(
-            function_name=function_name,
-            status="error",
-            summary=f"Error executing {function_name}: {str(e)}",
-            details={"error": str(e), "params": params},
-            issues=[f"Function crashed: {str(e)}"],
-            recommendations=["Check function parameters", "Review error details"],
-            severity="low",
-            prevents_bringup=False
+        return _error_result(
+            function_name,
+            f"Error executing {function_name}: {str(e)}",
+            {"error": str(e), "params": params},
+            f"Function crashed: {str(e)}",
+            _CRASHED_FUNCTION_RECOMMENDATIONS
         )
 
 
 def get_available_functions() -> list[str]:
     """Get list of all available analysis function names"""
-    return sorted(ANALYSIS_FUNCTIONS.keys())
+    return sorted(_FUNCTION_SOURCES)
 
 
 __all__ = [
@@ -128,4 +185,4 @@ __all__ = [
     'execute_analysis_function',
     'get_available_functions',
     'AnalysisResult'
-]
\ No newline at end of file
+]
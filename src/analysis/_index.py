@@ -0,0 +1,62 @@
+# src/analysis/_index.py
+"""
+Lookup tables over the schematic/netlist, built once and cached on the
+Schematic / NetBuildResult objects they index.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple
+# Symbol buckets and the ref index are shared with the top-level modules
+from ..index import placed_symbols, symbols_by_ref, symbols_of_kind
+
+
+def nets_by_name(net_build) -> Dict[str, object]:
+    """net name -> net. The first net wins on duplicate names."""
+    index = getattr(net_build, "_net_by_name", None)
+    if index is None:
+        index = {}
+        for net in net_build.nets:
+            index.setdefault(net.name, net)
+        net_build._net_by_name = index
+    return index
+
+
+def upper_net_names(net_build) -> List[str]:
+    """net.name.upper() for every net, parallel to net_build.nets"""
+    names = getattr(net_build, "_upper_names", None)
+    if names is None:
+        names = net_build._upper_names = [n.name.upper() for n in net_build.nets]
+    return names
+
+
+def has_gnd_net(net_build) -> bool:
+    """Whether any net name contains GND"""
+    has_gnd = getattr(net_build, "_has_gnd", None)
+    if has_gnd is None:
+        has_gnd = net_build._has_gnd = any('GND' in u for u in upper_net_names(net_build))
+    return has_gnd
+
+
+def placed_capacitors(sch) -> List[Tuple[object, int, int]]:
+    """(symbol, x, y) for every placed C* symbol, in schematic order"""
+    caps = getattr(sch, "_placed_caps", None)
+    if caps is None:
+        caps = sch._placed_caps = [(s, s.at[0], s.at[1]) for s in placed_symbols(sch, 'C')]
+    return caps
+
+
+def absolute_pins(sym) -> List[Tuple[int, int, Dict[str, Any], str]]:
+    """
+    (x, y, pin, NAME) in schematic coordinates for every pin with a position,
+    NAME being the pin name upper-cased. Cached on the symbol.
+    """
+    pins = getattr(sym, "_abs_pins", None)
+    if pins is None:
+        pins = []
+        if sym.at:
+            sx, sy = sym.at
+            for pin in sym.pins:
+                if 'at' in pin:
+                    px, py = pin['at']
+                    pins.append((sx + px, sy + py, pin, pin.get('name', '').upper()))
+        sym._abs_pins = pins
+    return pins
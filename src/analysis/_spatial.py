@@ -0,0 +1,92 @@
+# src/analysis/_spatial.py
+"""
+Spatial lookup helpers shared by the analysis functions.
+"""
+from __future__ import annotations
+from typing import Any, List, Set
+from ..index import Point, PointGrid
+from ._index import absolute_pins, placed_symbols
+
+
+def all_nodes(net_build) -> Set[Point]:
+    """Set of every net node position, cached on the NetBuildResult"""
+    nodes = getattr(net_build, "_all_nodes", None)
+    if nodes is None:
+        nodes = net_build._all_nodes = {node for net in net_build.nets for node in net.nodes}
+    return nodes
+
+
+def all_nodes_grid(net_build, cell: int = 3) -> PointGrid:
+    """Grid over the nodes of every net, cached on the NetBuildResult"""
+    grid = getattr(net_build, "_all_nodes_grid", None)
+    if grid is None or grid.cell != cell:
+        grid = PointGrid(cell)
+        for node in all_nodes(net_build):
+            grid.add(node, None)
+        net_build._all_nodes_grid = grid
+    return grid
+
+
+def resistor_pin_grid(sch, cell: int = 3) -> PointGrid:
+    """Grid of absolute resistor pin positions, items are resistor refs. Cached on the schematic."""
+    grid = getattr(sch, "_resistor_pin_grid", None)
+    if grid is None or grid.cell != cell:
+        grid = PointGrid(cell)
+        for sym in placed_symbols(sch, 'R'):
+            for x, y, _, _ in absolute_pins(sym):
+                grid.add((x, y), sym.ref)
+        sch._resistor_pin_grid = grid
+    return grid
+
+
+def resistor_grid(sch, cell: int = 50) -> PointGrid:
+    """
+    Grid of placed resistors, items are indices into placed_symbols(sch, 'R').
+    Built once per schematic and cached on it.
+    """
+    grid = getattr(sch, "_resistor_grid", None)
+    if grid is None or grid.cell != cell:
+        grid = PointGrid(cell)
+        for i, sym in enumerate(placed_symbols(sch, 'R')):
+            grid.add(sym.at, i)
+        sch._resistor_grid = grid
+    return grid
+
+
+def net_node_grid(net_build, net_names, cell: int) -> PointGrid:
+    """
+    Grid over all nodes of the named nets, items are the node positions.
+    Cached on the NetBuildResult per (net_names, cell).
+    """
+    cache = getattr(net_build, "_net_node_grids", None)
+    if cache is None:
+        cache = net_build._net_node_grids = {}
+    key = (frozenset(net_names), cell)
+    grid = cache.get(key)
+    if grid is None:
+        grid = PointGrid(cell)
+        for net in net_build.nets:
+            if net.name in key[0]:
+                for node in net.nodes:
+                    grid.add(node, node)
+        cache[key] = grid
+    return grid
+
+
+def nearby_resistors(sch, net, radius: int = 50) -> List[Any]:
+    """
+    Resistors closer than `radius` to any node of `net`, in schematic order.
+    Cached on the schematic per (net, radius) so MCU checks looking at the
+    same net share the work.
+    """
+    cache = getattr(sch, "_nearby_resistors", None)
+    if cache is None:
+        cache = sch._nearby_resistors = {}
+    key = (id(net), radius)
+    entry = cache.get(key)
+    if entry is None or entry[0] is not net:
+        grid = resistor_grid(sch)
+        hits = sorted({i for node in net.nodes for i in grid.near(node, radius)})
+        resistors = placed_symbols(sch, 'R')
+        entry = cache[key] = (net, [resistors[i] for i in hits])
+    return entry[1]
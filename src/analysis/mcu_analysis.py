@@ -1,10 +1,20 @@
-# src/analysis/mcu_analysis.py - ENHANCED VERSION
+# src/analysis/mcu_analysis.py
 """
 MCU-specific analysis functions with improved detection
 """
 from __future__ import annotations
+import re
 from typing import Dict, List, Any
-from .power_analysis import AnalysisResult
+from .types import (
+    AnalysisResult,
+    SEV_CRIT, SEV_HIGH, SEV_LOW, SEV_MED,
+    STATUS_FAIL, STATUS_PASS, STATUS_WARN,
+)
+from ._index import has_gnd_net, nets_by_name, symbols_by_ref, upper_net_names
+from ._spatial import nearby_resistors, net_node_grid
+
+# NRST is covered by RST
+_RESET_NET_RE = re.compile(r"RST|RESET")
 
 
 def analyze_reset_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
@@ -25,23 +35,23 @@ def analyze_reset_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisRes
     details = {'reset_pin': reset_pin, 'pullup_required': needs_pullup}
     
     # Find MCU
-    mcu = next((s for s in sch.symbols if s.ref == mcu_ref), None)
+    mcu = symbols_by_ref(sch).get(mcu_ref)
     if not mcu:
         issues.append(f"MCU {mcu_ref} not found")
         return AnalysisResult(
             function_name="analyze_reset_circuit",
-            status="fail",
+            status=STATUS_FAIL,
             summary=f"Reset circuit for {mcu_ref} - MCU not found",
             details=details,
             issues=issues,
             recommendations=["Verify MCU component reference"],
-            severity="critical",
+            severity=SEV_CRIT,
             prevents_bringup=True
         )
   
     reset_net = None
-    for net in net_build.nets:
-        if any(kw in net.name.upper() for kw in ['NRST', 'RST', 'RESET']):
+    for net, upper in zip(net_build.nets, upper_net_names(net_build)):
+        if _RESET_NET_RE.search(upper):
             reset_net = net.name
             break
     
@@ -50,48 +60,38 @@ def analyze_reset_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisRes
     
     if reset_net:
         details['reset_net'] = reset_net
-        net_obj = next((n for n in net_build.nets if n.name == reset_net), None)
+        net_obj = nets_by_name(net_build).get(reset_net)
         
         if net_obj:
-            for sym in sch.symbols:
-                if sym.ref.startswith('R') and sym.at:
-                    for node in net_obj.nodes:
-                        if sym.at:
-                            distance = ((sym.at[0] - node[0])**2 + (sym.at[1] - node[1])**2)**0.5
-                            if distance < 50:
-                                is_pullup = False
-                                for pwr_net in net_build.nets:
-                                    if pwr_net.name in ['VDD', 'VCC', '+3V3', '+5V', '3V3', '5V']:
-                                        for pwr_node in pwr_net.nodes:
-                                            pwr_dist = ((sym.at[0] - pwr_node[0])**2 + (sym.at[1] - pwr_node[1])**2)**0.5
-                                            if pwr_dist < 100: # Allow some distance for the resistor body
-                                                is_pullup = True
-                                                break
-                                    if is_pullup: break
-                                
-                                if is_pullup:
-                                    pullup_found = True
-                                    pullup_ref = sym.ref
-                                    break
-                if pullup_found:
-                    break
+            # Resistors within 50 units of the reset net, in schematic order
+            candidates = nearby_resistors(sch, net_obj, 50)
+            
+            if candidates:
+                pwr_grid = net_node_grid(net_build, ['VDD', 'VCC', '+3V3', '+5V', '3V3', '5V'], 100)
+                
+                for sym in candidates:
+                    # Allow some distance for the resistor body
+                    if next(pwr_grid.near(sym.at, 100), None) is not None:
+                        pullup_found = True
+                        pullup_ref = sym.ref
+                        break
     
     # Evaluate result
     if needs_pullup and not pullup_found:
         issues.append(f"CRITICAL: Missing reset pull-up resistor on {mcu_ref} pin {reset_pin} (NRST)")
         recommendations.append(f"Add 10kΩ pull-up resistor from {mcu_ref} NRST (pin {reset_pin}) to VDD/3V3")
         recommendations.append("This is REQUIRED for reliable MCU reset and prevents floating NRST pin")
-        status = "fail"
-        severity = "critical"
+        status = STATUS_FAIL
+        severity = SEV_CRIT
     elif pullup_found:
         details['pullup_resistor'] = pullup_ref
         recommendations.append(f"Reset pull-up found: {pullup_ref}")
-        status = "pass"
-        severity = "low"
+        status = STATUS_PASS
+        severity = SEV_LOW
     else:
         recommendations.append(f"Verify reset pull-up on pin {reset_pin}")
-        status = "warning"
-        severity = "medium"
+        status = STATUS_WARN
+        severity = SEV_MED
     
     return AnalysisResult(
         function_name="analyze_reset_circuit",
@@ -101,7 +101,7 @@ def analyze_reset_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisRes
         issues=issues,
         recommendations=recommendations,
         severity=severity,
-        prevents_bringup=(status == "fail")
+        prevents_bringup=(status == STATUS_FAIL)
     )
 
 
@@ -122,39 +122,39 @@ def check_boot_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     recommendations = []
     details = {'boot_pins': boot_pins, 'expected_state': expected_state}
     
-    mcu = next((s for s in sch.symbols if s.ref == mcu_ref), None)
+    mcu = symbols_by_ref(sch).get(mcu_ref)
     if not mcu:
         issues.append(f"MCU {mcu_ref} not found")
         return AnalysisResult(
             function_name="check_boot_pins",
-            status="fail",
+            status=STATUS_FAIL,
             summary=f"Boot pin check for {mcu_ref}",
             details=details,
             issues=issues,
             recommendations=[],
-            severity="critical",
+            severity=SEV_CRIT,
             prevents_bringup=True
         )
     
+    # BOOT nets and their nearby resistors don't depend on the pin, scan them once
+    boot_net = None
+    boot_resistor = None
+    for net, upper in zip(net_build.nets, upper_net_names(net_build)):
+        if 'BOOT' in upper:
+            boot_net = net.name
+            
+            nearby = nearby_resistors(sch, net, 50)
+            if nearby:
+                boot_resistor = nearby[-1].ref
+    
+    pulldown_found = boot_resistor is not None
+    tied_to_gnd = boot_net is not None and has_gnd_net(net_build)
+    
     for pin in boot_pins:
-        pulldown_found = False
-        tied_to_gnd = False
-        
-        for net in net_build.nets:
-            if 'BOOT' in net.name.upper():
-                details[f'boot_net_pin{pin}'] = net.name
-                
-                for sym in sch.symbols:
-                    if sym.ref.startswith('R') and sym.at:
-                        for node in net.nodes:
-                            distance = ((sym.at[0] - node[0])**2 + (sym.at[1] - node[1])**2)**0.5
-                            if distance < 50:
-                                pulldown_found = True
-                                details[f'boot_resistor_pin{pin}'] = sym.ref
-                                break
-                
-                if any('GND' in net.name.upper() for net in net_build.nets):
-                    tied_to_gnd = True
+        if boot_net is not None:
+            details[f'boot_net_pin{pin}'] = boot_net
+        if boot_resistor is not None:
+            details[f'boot_resistor_pin{pin}'] = boot_resistor
         
         if not pulldown_found and not tied_to_gnd and expected_state == 'LOW':
             issues.append(f"WARNING: BOOT pin {pin} appears floating (should be pulled LOW)")
@@ -162,11 +162,11 @@ def check_boot_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
             recommendations.append("Floating BOOT pin can cause boot mode issues")
     
     if issues:
-        status = "warning"
-        severity = "medium"
+        status = STATUS_WARN
+        severity = SEV_MED
     else:
-        status = "pass"
-        severity = "low"
+        status = STATUS_PASS
+        severity = SEV_LOW
         if boot_pins:
             recommendations.append(f"BOOT pins configuration OK")
     
@@ -182,9 +182,8 @@ def check_boot_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     )
 
 
-def verify_mcu_boot_configuration(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
-    """Alias for check_boot_pins for compatibility"""
-    return check_boot_pins(params, sch, net_build)
+# Alias for check_boot_pins for compatibility
+verify_mcu_boot_configuration = check_boot_pins
 
 
 def check_debug_interface(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
@@ -199,20 +198,20 @@ def check_debug_interface(params: Dict[str, Any], sch, net_build) -> AnalysisRes
     
     missing_nets = []
     for net_name in required_nets:
-        net = next((n for n in net_build.nets if n.name == net_name), None)
+        net = nets_by_name(net_build).get(net_name)
         if not net:
             missing_nets.append(net_name)
     
     if missing_nets:
         issues.append(f"Missing {interface_type} signals: {', '.join(missing_nets)}")
         recommendations.append(f"Add {interface_type} connector with signals: {', '.join(required_nets)}")
-        status = "fail"
-        severity = "critical"
+        status = STATUS_FAIL
+        severity = SEV_CRIT
     else:
         details['nets_found'] = required_nets
         recommendations.append(f"Verify {interface_type} connector pinout matches programmer")
-        status = "pass"
-        severity = "medium"
+        status = STATUS_PASS
+        severity = SEV_MED
     
     return AnalysisResult(
         function_name="check_debug_interface",
@@ -222,7 +221,7 @@ def check_debug_interface(params: Dict[str, Any], sch, net_build) -> AnalysisRes
         issues=issues,
         recommendations=recommendations,
         severity=severity,
-        prevents_bringup=(status == "fail")
+        prevents_bringup=(status == STATUS_FAIL)
     )
 
 
@@ -236,18 +235,18 @@ def verify_programming_interface(params: Dict[str, Any], sch, net_build) -> Anal
     recommendations = []
     details = {'programmer': prog_type, 'connector': connector_ref}
     
-    connector = next((s for s in sch.symbols if s.ref == connector_ref), None)
+    connector = symbols_by_ref(sch).get(connector_ref)
     
     if not connector:
         issues.append(f"Programming connector {connector_ref} not found")
         recommendations.append(f"Add {prog_type} compatible programming header")
-        status = "fail"
-        severity = "critical"
+        status = STATUS_FAIL
+        severity = SEV_CRIT
     else:
         details['connector_found'] = True
         recommendations.append(f"Verify {connector_ref} pinout matches {prog_type} programmer")
-        status = "pass"
-        severity = "medium"
+        status = STATUS_PASS
+        severity = SEV_MED
     
     return AnalysisResult(
         function_name="verify_programming_interface",
@@ -257,7 +256,7 @@ def verify_programming_interface(params: Dict[str, Any], sch, net_build) -> Anal
         issues=issues,
         recommendations=recommendations,
         severity=severity,
-        prevents_bringup=(status == "fail")
+        prevents_bringup=(status == STATUS_FAIL)
     )
 
 
@@ -282,8 +281,8 @@ def check_mcu_power_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResu
     if needs_vdda:
         recommendations.append(f"Verify VDDA pin has separate filtering (LC or ferrite bead + cap)")
     
-    status = "pass"
-    severity = "high"
+    status = STATUS_PASS
+    severity = SEV_HIGH
     
     return AnalysisResult(
         function_name="check_mcu_power_pins",
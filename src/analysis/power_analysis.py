@@ -1,24 +1,14 @@
-# src/analysis_functions/power_analysis.py
+# src/analysis/power_analysis.py
 """
 Modular power analysis functions for PCB debugging.
 Each function is granular and can be called independently.
 """
 from __future__ import annotations
+import math
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-
-
-@dataclass
-class AnalysisResult:
-    """Standardized result from analysis functions"""
-    function_name: str
-    status: str  # "pass", "fail", "warning", "info"
-    summary: str
-    details: Dict[str, Any]
-    issues: List[str]
-    recommendations: List[str]
-    severity: str  # "critical", "high", "medium", "low"
-    prevents_bringup: bool
+from ..netlist_build import pos_key
+from ._index import nets_by_name, placed_capacitors, symbols_by_ref
+from .types import AnalysisResult
 
 
 def verify_power_connectivity(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
@@ -32,6 +22,7 @@ def verify_power_connectivity(params: Dict[str, Any], sch, net_build) -> Analysi
         gnd_pins: List[str] - Ground pin numbers
     """
     power_nets = params.get('power_nets', [])
+    power_net_set = frozenset(power_nets)
     ic_ref = params.get('ic_ref')
     
     issues = []
@@ -40,16 +31,18 @@ def verify_power_connectivity(params: Dict[str, Any], sch, net_build) -> Analysi
     
     # Check if power net labels are connected
     unconnected_power = []
-    for label in sch.labels:
-        if label.text in power_nets:
-            if label.at and label.at not in net_build.label_attached:
+    if power_net_set:
+        attached = net_build.label_attached_keys
+        power_labels = (l for l in sch.labels if l.text in power_net_set and l.at)
+        for label in power_labels:
+            if pos_key(label.at) not in attached:
                 unconnected_power.append(label.text)
                 issues.append(f"Power net '{label.text}' label not connected to any wire at position ({label.at[0]}, {label.at[1]})")
     
     details['unconnected_power_labels'] = unconnected_power
     
     # Check if IC exists
-    ic = next((s for s in sch.symbols if s.ref == ic_ref), None)
+    ic = symbols_by_ref(sch).get(ic_ref)
     if not ic:
         issues.append(f"IC {ic_ref} not found in schematic")
         status = "fail"
@@ -66,12 +59,12 @@ def verify_power_connectivity(params: Dict[str, Any], sch, net_build) -> Analysi
     
     # Check for nearby decoupling caps
     if ic and ic.at:
+        ix, iy = ic.at
         nearby_caps = [
-            s for s in sch.symbols 
-            if s.ref.startswith('C') and s.at and
-            abs(s.at[0] - ic.at[0]) < 50 and abs(s.at[1] - ic.at[1]) < 50
+            s.ref for s, cx, cy in placed_capacitors(sch)
+            if abs(cx - ix) < 50 and abs(cy - iy) < 50
         ]
-        details['nearby_decoupling_caps'] = [c.ref for c in nearby_caps]
+        details['nearby_decoupling_caps'] = nearby_caps
         
         if not nearby_caps:
             recommendations.append(f"Add decoupling capacitor near {ic_ref} power pins")
@@ -109,9 +102,10 @@ def check_power_rail_routing(params: Dict[str, Any], sch, net_build) -> Analysis
     recommendations = []
     details = {}
     
+    nets = nets_by_name(net_build) if power_nets else {}
     for power_net_name in power_nets:
         # Find the net
-        net = next((n for n in net_build.nets if n.name == power_net_name), None)
+        net = nets.get(power_net_name)
         
         if not net:
             issues.append(f"Power net '{power_net_name}' not found in netlist")
@@ -157,24 +151,25 @@ def analyze_decoupling_capacitors(params: Dict[str, Any], sch, net_build) -> Ana
     recommendations = []
     details = {}
     
+    caps = placed_capacitors(sch)
+    t2 = threshold * threshold
+    
     for ic_ref in ic_refs:
-        ic = next((s for s in sch.symbols if s.ref == ic_ref), None)
+        ic = symbols_by_ref(sch).get(ic_ref)
         
         if not ic or not ic.at:
             continue
         
-        # Find nearby capacitors
+        # Find nearby capacitors (compare squared distances, sqrt only the hits)
+        ix, iy = ic.at
         nearby_caps = []
-        for sym in sch.symbols:
-            if not sym.ref.startswith('C') or not sym.at:
-                continue
-            
-            distance = ((ic.at[0] - sym.at[0])**2 + (ic.at[1] - sym.at[1])**2)**0.5
-            if distance < threshold:
+        for sym, cx, cy in caps:
+            d2 = (ix - cx)**2 + (iy - cy)**2
+            if d2 < t2:
                 nearby_caps.append({
                     'ref': sym.ref,
                     'value': sym.value,
-                    'distance': round(distance, 1)
+                    'distance': round(math.sqrt(d2), 1)
                 })
         
         details[ic_ref] = {
@@ -220,7 +215,7 @@ def verify_voltage_regulator_circuit(params: Dict[str, Any], sch, net_build) ->
     recommendations = []
     details = {}
     
-    regulator = next((s for s in sch.symbols if s.ref == reg_ref), None)
+    regulator = symbols_by_ref(sch).get(reg_ref)
     
     if not regulator:
         issues.append(f"Regulator {reg_ref} not found")
@@ -1,38 +1,38 @@
-# src/analysis_functions/signal_analysis.py
+# src/analysis/signal_analysis.py
 """
 Signal integrity and connectivity analysis functions.
 """
 from __future__ import annotations
 from typing import Dict, List, Any
-from .power_analysis import AnalysisResult
+from .types import AnalysisResult
+from ._index import absolute_pins, nets_by_name, symbols_by_ref, upper_net_names
+from ._spatial import all_nodes, all_nodes_grid, resistor_pin_grid
 
 
 def _is_pin_connected(at, net_build) -> bool:
     """Check if a coordinate is connected to any net node."""
     if not at: return False
-    x, y = at
+    # Pins normally sit exactly on a wire end: a single hash probe
+    if at in all_nodes(net_build):
+        return True
     # Tolerance for connection (2.54 units = 100 mil)
     TOLERANCE = 3.0 
-    for net in net_build.nets:
-        for nx, ny in net.nodes:
-            if abs(x - nx) <= TOLERANCE and abs(y - ny) <= TOLERANCE:
-                return True
-    return False
+    return all_nodes_grid(net_build).any_in_box(at, TOLERANCE)
 
 def check_floating_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     """
     Check for floating pins that should be tied high or low.
     """
     ic_ref = params.get('ic_ref')
-    critical_pins = params.get('critical_pins', [])
-    exclude_pins = params.get('exclude_pins', ["NC", "NB"])
+    critical_pins = frozenset(params.get('critical_pins', ()))
+    exclude_pins = frozenset(params.get('exclude_pins', ("NC", "NB")))
     expected_state = params.get('expected_state', 'HIGH')
     
     issues = []
     recommendations = []
     details = {}
     
-    ic = next((s for s in sch.symbols if s.ref == ic_ref), None)
+    ic = symbols_by_ref(sch).get(ic_ref)
     
     if not ic:
         issues.append(f"IC {ic_ref} not found")
@@ -49,10 +49,8 @@ def check_floating_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResul
             issues.append(f"IC {ic_ref} has no position data")
             status = "fail"
         else:
-            ix, iy = ic.at
-            
-            # Check pins
-            for pin in ic.pins:
+            # Check pins (only positioned pins can be checked for a connection)
+            for x, y, pin, _ in absolute_pins(ic):
                 p_name = pin.get('name', '??')
                 p_num = pin.get('number', '?')
                 
@@ -63,18 +61,15 @@ def check_floating_pins(params: Dict[str, Any], sch, net_build) -> AnalysisResul
                     continue
                 
                 # Check connection
-                if 'at' in pin:
-                    px, py = pin['at']
-                    abs_at = (ix + px, iy + py)
-                    
-                    if not _is_pin_connected(abs_at, net_build):
-                        floating.append(f"{p_num}({p_name})")
+                if not _is_pin_connected((x, y), net_build):
+                    floating.append(f"{p_num}({p_name})")
                         
             if floating:
                 status = "warning"
                 severity = "medium"
-                issues.append(f"Pins floating: {', '.join(floating)}")
-                recommendations.append(f"Verify {ic_ref} pins {', '.join(floating)} are connected")
+                pins_str = ', '.join(floating)
+                issues.append(f"Pins floating: {pins_str}")
+                recommendations.append(f"Verify {ic_ref} pins {pins_str} are connected")
             else:
                 status = "pass"
                 severity = "low"
@@ -106,7 +101,6 @@ def verify_pull_up_pull_down(params: Dict[str, Any], sch, net_build) -> Analysis
     res_range = params.get('resistor_range', (1000, 100000))  # 1k to 100k default
     
     issues = []
-    recommendations = []
     details = {}
     
     for net_name in nets_to_check:
@@ -116,16 +110,20 @@ def verify_pull_up_pull_down(params: Dict[str, Any], sch, net_build) -> Analysis
             'pull_type_required': pull_type,
             'resistance_range': res_range
         }
-        
-        recommendations.append(f"Verify {net_name} has {res_range[0]/1000:.1f}k-{res_range[1]/1000:.0f}k pull-{pull_type} resistor")
     
+    range_str = f"{res_range[0]/1000:.1f}k-{res_range[1]/1000:.0f}k" if nets_to_check else ""
+    recommendations = [
+        f"Verify {net_name} has {range_str} pull-{pull_type} resistor"
+        # Same net listed twice -> one recommendation (first occurrence keeps its place)
+        for net_name in dict.fromkeys(nets_to_check)
+    ]
     status = "info"
     severity = "low"
     
     return AnalysisResult(
         function_name="verify_pull_up_pull_down",
         status=status,
-        summary=f"Pull-{pull_type} verification: {len(nets_to_check)} nets",
+        summary=f"Pull-{pull_type} verification: {len(details)} nets",
         details=details,
         issues=issues,
         recommendations=recommendations,
@@ -151,7 +149,7 @@ def trace_signal_path(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     recommendations = []
     details = {}
     
-    net = next((n for n in net_build.nets if n.name == net_name), None)
+    net = nets_by_name(net_build).get(net_name)
     
     if not net:
         issues.append(f"Net {net_name} not found in netlist")
@@ -198,8 +196,9 @@ def verify_ground_plane(params: Dict[str, Any], sch, net_build) -> AnalysisResul
     recommendations = []
     details = {}
     
+    nets = nets_by_name(net_build) if ground_nets and net_build.nets else {}
     for gnd_net in ground_nets:
-        net = next((n for n in net_build.nets if n.name == gnd_net), None)
+        net = nets.get(gnd_net)
         
         if not net:
             issues.append(f"Ground net {gnd_net} not found")
@@ -242,18 +241,19 @@ def check_differential_pairs(params: Dict[str, Any], sch, net_build) -> Analysis
     tolerance = params.get('tolerance', 0.5)
     
     issues = []
-    recommendations = []
-    details = {}
-    
-    for pos_net, neg_net in pairs:
-        details[f"{pos_net}_{neg_net}"] = {
-            'pair': [pos_net, neg_net],
-            'tolerance_mm': tolerance
-        }
-        
-        recommendations.append(f"Verify {pos_net}/{neg_net} differential pair length matching within {tolerance}mm")
-        recommendations.append(f"Keep {pos_net}/{neg_net} traces parallel and equal length")
+    details = {
+        f"{pos_net}_{neg_net}": {'pair': [pos_net, neg_net], 'tolerance_mm': tolerance}
+        for pos_net, neg_net in pairs
+    }
     
+    recommendations = list(dict.fromkeys(
+        rec
+        for pos_net, neg_net in pairs
+        for rec in (
+            f"Verify {pos_net}/{neg_net} differential pair length matching within {tolerance}mm",
+            f"Keep {pos_net}/{neg_net} traces parallel and equal length",
+        )
+    ))
     status = "info"
     severity = "low"
     
@@ -281,12 +281,12 @@ def analyze_signal_termination(params: Dict[str, Any], sch, net_build) -> Analys
     term_type = params.get('termination_type', 'none')
     
     issues = []
-    recommendations = []
     details = {'termination_type': term_type}
     
     if term_type != 'none':
-        for net in signals:
-            recommendations.append(f"Verify {net} has {term_type} termination resistor")
+        recommendations = [f"Verify {net} has {term_type} termination resistor" for net in signals]
+    else:
+        recommendations = []
     
     status = "info"
     severity = "low"
@@ -308,10 +308,10 @@ def verify_i2c_bus(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     Check for I2C configuration (Pull-ups).
     """
     # 1. Find I2C nets
-    i2c_nets = []
-    for net in net_build.nets:
-        if 'SDA' in net.name.upper() or 'SCL' in net.name.upper():
-            i2c_nets.append(net)
+    i2c_nets = [
+        net for net, upper in zip(net_build.nets, upper_net_names(net_build))
+        if 'SDA' in upper or 'SCL' in upper
+    ]
             
     # 2. Fallback: Find I2C pins on components if no nets named SDA/SCL
     found_i2c_pins = False
@@ -319,19 +319,14 @@ def verify_i2c_bus(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
     
     if not i2c_nets:
         # Scan symbols for SDA/SCL pins
+        # (parsed pins always carry a position, so the absolute pin table covers them all)
         for sym in sch.symbols:
-            if not sym.at: continue
-            sx, sy = sym.at
-            for pin in sym.pins:
-                name = pin.get('name', '').upper()
+            for x, y, _, name in absolute_pins(sym):
                 if 'SDA' in name or 'SCL' in name:
                     found_i2c_pins = True
                     # Check if connected
-                    if 'at' in pin:
-                        px, py = pin['at']
-                        abs_at = (sx + px, sy + py)
-                        if not _is_pin_connected(abs_at, net_build):
-                            floating_i2c_pins.append(f"{sym.ref}.{name}")
+                    if not _is_pin_connected((x, y), net_build):
+                        floating_i2c_pins.append(f"{sym.ref}.{name}")
 
     issues = []
     recommendations = []
@@ -344,24 +339,10 @@ def verify_i2c_bus(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
         status = "pass"
         # Check for pull-ups (resistors connected to these nets AND power)
         # Simplified: just look for Resistors on the net
+        # Heuristic: a resistor pin within 3 units of any node of the net
+        r_pins = resistor_pin_grid(sch)
         for net in i2c_nets:
-            has_resistor = False
-            for node in net.nodes:
-                # Find component at node
-                # Heuristic: iterate symbols, check IF resistor, check IF pin at node
-                for sym in sch.symbols:
-                    if sym.ref.startswith('R') and sym.at:
-                        # Check pins
-                        r_sx, r_sy = sym.at
-                        for r_pin in sym.pins:
-                            if 'at' in r_pin:
-                                rx, ry = r_pin['at']
-                                r_abs = (r_sx + rx, r_sy + ry)
-                                # Distance check
-                                if abs(r_abs[0] - node[0]) < 3.0 and abs(r_abs[1] - node[1]) < 3.0:
-                                    has_resistor = True
-                                    break
-                    if has_resistor: break
+            has_resistor = any(r_pins.any_in_box(node, 3.0, strict=True) for node in net.nodes)
             
             if not has_resistor:
                 issues.append(f"No pull-up resistor detected on I2C net {net.name}")
@@ -1,11 +1,23 @@
-# src/analysis_functions/timing_analysis.py
+# src/analysis/timing_analysis.py
 """
 Modular timing and clock analysis functions.
 """
 from __future__ import annotations
+import functools
 import re
-from typing import Dict, List, Any
-from .power_analysis import AnalysisResult
+from typing import Dict, List, Any, Optional
+from .types import AnalysisResult
+from ._index import nets_by_name, symbols_by_ref
+
+# Everything that cannot be part of a float literal
+_NON_NUMERIC = re.compile(r'[^0-9.eE+-]')
+
+# Unit suffix -> exponent appended before float() (upper-cased input).
+# 'µ'.upper() is the Greek capital mu, so both spellings are listed.
+_R_SUFFIX_EXP = {'K': 'e3', 'M': 'e6', 'R': ''}
+_C_SUFFIX_EXP = {'U': 'e-6', 'µ': 'e-6', 'Μ': 'e-6', 'N': 'e-9', 'P': 'e-12'}
+# Same expansion for the general capacitance parser, in one translate() pass
+_C_UNIT_TABLE = str.maketrans({**_C_SUFFIX_EXP, 'F': None})
 
 
 def analyze_rc_timing_network(params: Dict[str, Any], sch, net_build) -> AnalysisResult:
@@ -42,8 +54,9 @@ def analyze_rc_timing_network(params: Dict[str, Any], sch, net_build) -> Analysi
     # Calculate timing if all values found
     if r1_val and c1_val:
         if r2_val:  # Astable mode (555)
-            frequency = 1.44 / ((r1_val + 2*r2_val) * c1_val)
-            duty_cycle = (r1_val + r2_val) / (r1_val + 2*r2_val) * 100
+            denom = r1_val + 2*r2_val
+            frequency = 1.44 / (denom * c1_val)
+            duty_cycle = (r1_val + r2_val) / denom * 100
             period = 1 / frequency
             
             details['calculated_timing'] = {
@@ -115,7 +128,7 @@ def verify_crystal_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisRe
     details = {}
     
     # Check crystal exists
-    crystal = next((s for s in sch.symbols if s.ref == crystal_ref), None)
+    crystal = symbols_by_ref(sch).get(crystal_ref)
     if not crystal:
         issues.append(f"Crystal {crystal_ref} not found")
         status = "fail"
@@ -129,13 +142,13 @@ def verify_crystal_circuit(params: Dict[str, Any], sch, net_build) -> AnalysisRe
         
         # Check load capacitors
         found_caps = []
+        by_ref = symbols_by_ref(sch)
         for cap_ref in load_caps:
-            cap = next((s for s in sch.symbols if s.ref == cap_ref), None)
+            cap = by_ref.get(cap_ref)
             if cap:
-                cap_val = _extract_capacitance(sch, cap_ref)
                 found_caps.append({
                     'ref': cap_ref,
-                    'value': cap_val
+                    'value': _symbol_capacitance(cap)
                 })
         
         details['load_capacitors'] = found_caps
@@ -187,8 +200,9 @@ def check_clock_distribution(params: Dict[str, Any], sch, net_build) -> Analysis
     recommendations = []
     details = {}
     
+    nets = nets_by_name(net_build) if clock_nets and net_build.nets else {}
     for clock_net in clock_nets:
-        net = next((n for n in net_build.nets if n.name == clock_net), None)
+        net = nets.get(clock_net)
         
         if net:
             fanout = len(net.nodes)
@@ -220,32 +234,68 @@ def check_clock_distribution(params: Dict[str, Any], sch, net_build) -> Analysis
 
 def _extract_resistance(sch, ref: str) -> float:
     """Extract resistance value in ohms"""
-    sym = next((s for s in sch.symbols if s.ref == ref), None)
+    sym = symbols_by_ref(sch).get(ref)
     if not sym or not sym.value:
         return None
-    
-    try:
-        # Handle formats: "10k", "10K", "4.7k", "1M", "100"
-        val_str = sym.value.upper()
-        val_str = val_str.replace('K', 'e3').replace('M', 'e6').replace('Ω', '').replace('OHM', '')
-        val_str = re.sub(r'[^0-9.eE+-]', '', val_str)
-        return float(val_str)
-    except:
-        return None
+    return _parse_resistance(sym.value)
 
 
 def _extract_capacitance(sch, ref: str) -> float:
     """Extract capacitance value in farads"""
-    sym = next((s for s in sch.symbols if s.ref == ref), None)
+    return _symbol_capacitance(symbols_by_ref(sch).get(ref))
+
+
+def _symbol_capacitance(sym) -> float:
+    """Capacitance in farads of an already looked-up symbol"""
     if not sym or not sym.value:
         return None
-    
+    return _parse_capacitance(sym.value)
+
+
+# Value strings repeat heavily within and across schematics ("10k", "100nF"),
+# so the parsed numbers are memoized on the string itself.
+@functools.cache
+def _parse_resistance(value: str) -> float:
+    # Fast path: plain number with an optional unit suffix ("10K", "4.7K", "100", "10KΩ")
+    s = value.strip().upper().removesuffix('OHM').removesuffix('Ω')
+    fast = _parse_suffixed(s, _R_SUFFIX_EXP)
+    if fast is not None:
+        return fast
+    # Other formats
+    val_str = value.upper()
+    val_str = val_str.replace('K', 'e3').replace('M', 'e6').replace('Ω', '').replace('OHM', '')
+    return _to_float(_NON_NUMERIC.sub('', val_str))
+
+
+@functools.cache
+def _parse_capacitance(value: str) -> float:
+    # Fast path: plain number with an optional unit prefix ("10UF", "100N", "22PF", "0.1µF")
+    s = value.strip().upper().removesuffix('F')
+    fast = _parse_suffixed(s, _C_SUFFIX_EXP)
+    if fast is not None:
+        return fast
+    # Other formats
+    val_str = value.upper().translate(_C_UNIT_TABLE)
+    return _to_float(_NON_NUMERIC.sub('', val_str))
+
+
+def _parse_suffixed(s: str, suffix_exp: Dict[str, str]) -> Optional[float]:
+    """float for an unsigned decimal with at most one known suffix, None if `s` is anything else"""
+    if not s:
+        return None
+    exp = suffix_exp.get(s[-1])
+    num = s if exp is None else s[:-1]
+    if num.isascii() and num.replace('.', '', 1).isdigit():
+        # Append the exponent rather than multiplying so "4.7K" is exactly 4700.0
+        return float(num + (exp or ''))
+    return None
+
+
+def _to_float(val_str: str) -> Optional[float]:
+    """float(val_str), or None for an empty/malformed leftover like "", "." or "e-6" """
+    if not val_str:
+        return None
     try:
-        # Handle formats: "10uF", "100nF", "22pF", "0.1µF"
-        val_str = sym.value.upper()
-        val_str = val_str.replace('µ', 'U').replace('U', 'e-6').replace('N', 'e-9').replace('P', 'e-12')
-        val_str = val_str.replace('F', '')
-        val_str = re.sub(r'[^0-9.eE+-]', '', val_str)
         return float(val_str)
-    except:
-        return None
\ No newline at end of file
+    except ValueError:
+        return None
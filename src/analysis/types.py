@@ -0,0 +1,32 @@
+# src/analysis/types.py
+"""
+Result type shared by all analysis functions.
+"""
+from __future__ import annotations
+from typing import Dict, List, Any, Final
+from dataclasses import dataclass
+
+# Shared status / severity values, so every module uses the same string objects
+STATUS_PASS: Final = "pass"
+STATUS_FAIL: Final = "fail"
+STATUS_WARN: Final = "warning"
+STATUS_INFO: Final = "info"
+STATUS_ERROR: Final = "error"
+
+SEV_LOW: Final = "low"
+SEV_MED: Final = "medium"
+SEV_HIGH: Final = "high"
+SEV_CRIT: Final = "critical"
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisResult:
+    """Standardized result from analysis functions"""
+    function_name: str
+    status: str  # "pass", "fail", "warning", "info"
+    summary: str
+    details: Dict[str, Any]
+    issues: List[str]
+    recommendations: List[str]
+    severity: str  # "critical", "high", "medium", "low"
+    prevents_bringup: bool
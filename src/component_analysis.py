@@ -4,8 +4,21 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 from src.kicad_extract import Schematic, SchSymbol, Point
 from src.netlist_build import Net, NetBuildResult
+from src.index import PointGrid, symbols_of_kind
 import re
 
+# Categorize pins based on common naming patterns
+POWER_PIN_RE = re.compile(r'(VDD|VCC|V\+|AVDD|DVDD|VBAT)', re.IGNORECASE)
+GND_PIN_RE = re.compile(r'(GND|VSS|V-|AGND|DGND)', re.IGNORECASE)
+
+# Value parsing for the 555 timing parts: SI suffix -> exponent, then drop anything non-numeric
+_R_SUFFIX_TABLE = str.maketrans({'K': 'e3', 'M': 'e6'})
+_C_SUFFIX_TABLE = str.maketrans({'U': 'e-6', 'N': 'e-9', 'P': 'e-12'})
+_NON_NUMERIC_RE = re.compile(r'[^0-9.eE+-]')
+
+# lib_id substrings (lower-case) indexed in CircuitTopology.by_family
+IC_FAMILIES = ('555',)
+
 @dataclass
 class PinConnection:
     """Represents a single pin connection"""
@@ -37,6 +50,7 @@ class CircuitTopology:
     critical_paths: List[Dict[str, any]]
     missing_decoupling: List[str]  # Component refs missing decoupling caps
     floating_inputs: List[PinConnection]
+    by_family: Dict[str, List[ComponentAnalysis]] = field(default_factory=dict)  # IC family -> components, map order
     
 def analyze_555_timer(comp: ComponentAnalysis, sch: Schematic, net_build: NetBuildResult) -> Dict:
     """Specific analysis for 555 timer circuits"""
@@ -49,22 +63,23 @@ def analyze_555_timer(comp: ComponentAnalysis, sch: Schematic, net_build: NetBui
     
     # Find R and C values connected to 555
     r1 = r2 = c1 = None
-    for sym in sch.symbols:
-        if sym.ref.startswith('R') and sym.value:
+    for sym in symbols_of_kind(sch, 'R'):
+        if sym.value:
             try:
                 # Extract resistance value (handle k, K, M suffixes)
-                val_str = sym.value.upper().replace('K', 'e3').replace('M', 'e6')
-                val = float(re.sub(r'[^0-9.eE+-]', '', val_str))
+                val_str = sym.value.upper().translate(_R_SUFFIX_TABLE)
+                val = float(_NON_NUMERIC_RE.sub('', val_str))
                 if 'R1' in sym.ref:
                     r1 = val
                 elif 'R2' in sym.ref:
                     r2 = val
             except:
                 pass
-        elif sym.ref.startswith('C') and sym.value:
+    for sym in symbols_of_kind(sch, 'C'):
+        if sym.value:
             try:
-                val_str = sym.value.upper().replace('U', 'e-6').replace('N', 'e-9').replace('P', 'e-12')
-                val = float(re.sub(r'[^0-9.eE+-]', '', val_str))
+                val_str = sym.value.upper().translate(_C_SUFFIX_TABLE)
+                val = float(_NON_NUMERIC_RE.sub('', val_str))
                 if 'C1' in sym.ref:
                     c1 = val
             except:
@@ -93,8 +108,7 @@ def analyze_555_timer(comp: ComponentAnalysis, sch: Schematic, net_build: NetBui
         analysis["issues"].append(f"Missing timing components: {', '.join(missing)}")
     
     # Check for control voltage filtering cap (pin 5)
-    has_cv_cap = any(sym.ref.startswith('C') and sym.ref != comp.ref 
-                     for sym in sch.symbols)
+    has_cv_cap = any(sym.ref != comp.ref for sym in symbols_of_kind(sch, 'C'))
     if not has_cv_cap:
         analysis["recommendations"].append(
             "Add 0.01µF ceramic cap from pin 5 (CTRL) to GND for noise immunity"
@@ -126,13 +140,9 @@ def analyze_component_interconnections(
             position=sym.at
         )
         
-        # Categorize pins based on common naming patterns
-        power_patterns = re.compile(r'(VDD|VCC|V\+|AVDD|DVDD|VBAT)', re.IGNORECASE)
-        gnd_patterns = re.compile(r'(GND|VSS|V-|AGND|DGND)', re.IGNORECASE)
-        
         # Simulate pin connections (in real implementation, parse from symbol definition)
         # For now, use heuristics based on component type
-        if sym.ref.startswith('U'):  # ICs
+        if sym.ref[:1] == 'U':  # ICs
             # Common IC power pin numbers
             for pin_num in ['1', '8', '4', '7']:  # Common DIP-8 power pins
                 # This is simplified - real implementation would parse actual pins
@@ -141,22 +151,26 @@ def analyze_component_interconnections(
         component_map[sym.ref] = comp
     
     # Second pass: find decoupling caps near ICs
-    ics = [ref for ref in component_map.keys() if ref.startswith('U')]
-    caps = [ref for ref in component_map.keys() if ref.startswith('C')]
+    refs_by_kind: Dict[str, List[str]] = {}
+    for ref in component_map:
+        refs_by_kind.setdefault(ref[:1], []).append(ref)
+    ics = refs_by_kind.get('U', [])
+    caps = refs_by_kind.get('C', [])
+    
+    # Bucket cap positions once; items are indices into caps so results keep map order
+    cap_grid = PointGrid(50)
+    for i, cap_ref in enumerate(caps):
+        cap_pos = component_map[cap_ref].position
+        if cap_pos:
+            cap_grid.add(cap_pos, i)
     
     for ic_ref in ics:
         ic = component_map[ic_ref]
         nearby_caps = []
         
         if ic.position:
-            for cap_ref in caps:
-                cap = component_map[cap_ref]
-                if cap.position:
-                    # Check if cap is within 50 units (simplified distance check)
-                    dx = abs(ic.position[0] - cap.position[0])
-                    dy = abs(ic.position[1] - cap.position[1])
-                    if dx < 50 and dy < 50:
-                        nearby_caps.append(cap_ref)
+            # Check if cap is within 50 units (simplified distance check)
+            nearby_caps = [caps[i] for i in sorted(cap_grid.in_box(ic.position, 50, strict=True))]
         
         ic.nearby_caps = nearby_caps
         
@@ -167,21 +181,27 @@ def analyze_component_interconnections(
     # Build power distribution tree
     for net in net_build.nets:
         if net.name in power_nets or 'GND' in net.name.upper():
-            consumers = []
-            for ref, comp in component_map.items():
-                # Check if this component connects to this power net
-                # (simplified - real implementation checks actual pin connections)
-                if ref.startswith('U'):
-                    consumers.append(ref)
+            # Every IC is taken to consume the net
+            # (simplified - real implementation checks actual pin connections)
+            consumers = list(ics)
             if consumers:
                 power_tree[net.name] = consumers
     
+    # Index components by IC family for generators that look one up by part
+    by_family: Dict[str, List[ComponentAnalysis]] = {}
+    for comp in component_map.values():
+        lib_id = comp.lib_id.lower()
+        for family in IC_FAMILIES:
+            if family in lib_id:
+                by_family.setdefault(family, []).append(comp)
+    
     return CircuitTopology(
         component_map=component_map,
         power_tree=power_tree,
         critical_paths=[],
         missing_decoupling=missing_decoupling,
-        floating_inputs=floating_inputs
+        floating_inputs=floating_inputs,
+        by_family=by_family
     )
 
 def get_pin_net_mapping(
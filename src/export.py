@@ -1,135 +1,168 @@
 # src/export.py
 """Export functionality for bring-up checklists"""
 
+import contextlib
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, IO, Iterator
+
+_SEVERITY_ICONS = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
+_RISK_BADGES = {
+    'low': '🟢 LOW',
+    'medium': '🟡 MED',
+    'high': '🔴 HIGH'
+}
+
+
+# Process umask, read once at import: temp files are created 0600 and get
+# chmod'ed to what a plain open() would have produced.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextlib.contextmanager
+def _atomic_output(output_path: str) -> Iterator[IO[str]]:
+    """
+    Text file to stream an export into. It is a temp file next to
+    `output_path` and only replaces it once the block completes, so a
+    failed export leaves neither a partial file nor a clobbered old one.
+    """
+    target = Path(output_path)
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', buffering=1 << 16,
+                                      dir=target.parent, prefix=f".{target.name}.",
+                                      suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            yield tmp
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
 
 
 def export_checklist_markdown(report: Dict[str, Any], output_path: str) -> None:
     """Export checklist to Markdown format"""
     
-    lines = []
+    # Stream straight to disk; the file only appears once everything was written
+    with _atomic_output(output_path) as f:
+        _write_checklist_markdown(report, f.write)
+
+
+def _write_checklist_markdown(report: Dict[str, Any], write) -> None:
+    """Emit the Markdown checklist for `report` through `write`"""
     
     # Header
-    lines.append(f"# PCB Bring-Up Checklist\n")
-    lines.append(f"**Schematic:** {Path(report['file']).name}\n")
-    lines.append(f"**Overall Risk:** {report['overall_risk']['level'].upper()} "
-                f"(Score: {report['overall_risk']['score']}/100)\n")
+    write(f"# PCB Bring-Up Checklist\n")
+    write(f"**Schematic:** {Path(report['file']).name}\n")
+    write(f"**Overall Risk:** {report['overall_risk']['level'].upper()} "
+          f"(Score: {report['overall_risk']['score']}/100)\n")
     
     # Detection Summary
-    lines.append("\n## Detection Summary\n")
+    write("\n## Detection Summary\n")
     detected = report.get('detected', {})
     
     if detected.get('power_nets'):
-        lines.append(f"**Power Nets:** {', '.join(detected['power_nets'])}\n")
+        write(f"**Power Nets:** {', '.join(detected['power_nets'])}\n")
     if detected.get('mcu_symbols'):
-        lines.append(f"**MCU/Main IC:** {', '.join(detected['mcu_symbols'])}\n")
+        write(f"**MCU/Main IC:** {', '.join(detected['mcu_symbols'])}\n")
     if detected.get('clock_sources'):
-        lines.append(f"**Clock Sources:** {', '.join(detected['clock_sources'])}\n")
+        write(f"**Clock Sources:** {', '.join(detected['clock_sources'])}\n")
     if detected.get('reset_nets'):
-        lines.append(f"**Reset Nets:** {', '.join(detected['reset_nets'])}\n")
+        write(f"**Reset Nets:** {', '.join(detected['reset_nets'])}\n")
     if detected.get('debug_ifaces'):
-        lines.append(f"**Debug Interfaces:** {', '.join(detected['debug_ifaces'])}\n")
+        write(f"**Debug Interfaces:** {', '.join(detected['debug_ifaces'])}\n")
     
     # Findings/Issues
     if report.get('findings'):
-        lines.append("\n## ⚠️ Critical Findings\n")
+        write("\n## ⚠️ Critical Findings\n")
         for finding in report['findings']:
-            severity_icon = {
-                'critical': '🔴',
-                'high': '🟠',
-                'medium': '🟡',
-                'low': '🟢'
-            }.get(finding.get('severity', 'medium'), '⚪')
+            severity_icon = _SEVERITY_ICONS.get(finding.get('severity', 'medium'), '⚪')
             
-            lines.append(f"\n### {severity_icon} {finding['summary']}\n")
-            lines.append(f"**Why:** {finding['why']}\n")
+            write(f"\n### {severity_icon} {finding['summary']}\n")
+            write(f"**Why:** {finding['why']}\n")
             if finding.get('fix_suggestion'):
-                lines.append(f"**Fix:** {finding['fix_suggestion']}\n")
+                write(f"**Fix:** {finding['fix_suggestion']}\n")
             if finding.get('prevents_bringup'):
-                lines.append(f"**BLOCKS BRING-UP**\n")
+                write(f"**BLOCKS BRING-UP**\n")
     
     # Checklist Steps
-    lines.append("\n## Bring-Up Checklist\n")
-    lines.append("Follow these steps in order. Mark each as you complete it.\n")
+    write("\n## Bring-Up Checklist\n")
+    write("Follow these steps in order. Mark each as you complete it.\n")
     
     for step in report.get('checklist', []):
-        risk_badge = {
-            'low': '🟢 LOW',
-            'medium': '🟡 MED',
-            'high': '🔴 HIGH'
-        }.get(step.get('risk', 'medium'), '⚪')
-        
-        lines.append(f"\n### [{step['sequence']}] {step['title']} - {risk_badge} RISK\n")
-        lines.append(f"**Category:** {step['category'].upper()}\n")
+        risk_badge = _RISK_BADGES.get(step.get('risk', 'medium'), '⚪')
         
-        if step.get('component'):
-            lines.append(f"**Component:** {step['component']}\n")
-        
-        lines.append(f"\n**Test Procedure:**\n{step['instruction']}\n")
-        lines.append(f"\n**Expected Result:**\n{step['expected']}\n")
-        
-        # Checkbox for manual tracking
-        lines.append(f"\n- [ ] Test Complete\n")
-        lines.append(f"- [ ] Result: PASS / FAIL\n")
+        component = f"**Component:** {step['component']}\n" if step.get('component') else ""
+        write(
+            f"\n### [{step['sequence']}] {step['title']} - {risk_badge} RISK\n"
+            f"**Category:** {step['category'].upper()}\n"
+            f"{component}"
+            f"\n**Test Procedure:**\n{step['instruction']}\n"
+            f"\n**Expected Result:**\n{step['expected']}\n"
+            # Checkbox for manual tracking
+            "\n- [ ] Test Complete\n"
+            "- [ ] Result: PASS / FAIL\n"
+        )
         
         if step.get('likely_faults'):
-            lines.append(f"\n**If This Step Fails - Likely Causes:**\n")
-            for fault in step['likely_faults']:
-                lines.append(f"- {fault}\n")
+            write("\n**If This Step Fails - Likely Causes:**\n"
+                  + "".join(f"- {fault}\n" for fault in step['likely_faults']))
         
         if step.get('fix_suggestions'):
-            lines.append(f"\n**Troubleshooting Steps:**\n")
-            for fix in step['fix_suggestions']:
-                lines.append(f"1. {fix}\n")
+            write("\n**Troubleshooting Steps:**\n"
+                  + "".join(f"1. {fix}\n" for fix in step['fix_suggestions']))
         
         if step.get('prevents_bringup'):
-            lines.append(f"\n> **CRITICAL**: This step must pass for the board to function.\n")
+            write("\n> **CRITICAL**: This step must pass for the board to function.\n")
         
-        lines.append("\n---\n")
+        write("\n---\n")
     
     # Test Points Recommendations
     if report.get('recommended_test_points'):
-        lines.append("\n## Recommended Test Points\n")
+        write("\n## Recommended Test Points\n")
         for tp in report['recommended_test_points']:
-            lines.append(f"\n**{tp['net']}**\n")
-            lines.append(f"- Why: {tp['why']}\n")
-            lines.append(f"- Measurement: {tp['measurement']}\n")
+            write(f"\n**{tp['net']}**\n")
+            write(f"- Why: {tp['why']}\n")
+            write(f"- Measurement: {tp['measurement']}\n")
     
     # Oscilloscope Configuration
     if report.get('scope_config'):
         scope = report['scope_config']
-        lines.append("\n##Oscilloscope Setup\n")
-        lines.append(f"**Circuit Type:** {scope['circuit_type']}\n")
-        lines.append(f"**Timebase:** {scope.get('timebase', 'Auto')}\n")
+        write("\n##Oscilloscope Setup\n")
+        write(f"**Circuit Type:** {scope['circuit_type']}\n")
+        write(f"**Timebase:** {scope.get('timebase', 'Auto')}\n")
         
         for ch in scope.get('channels', []):
-            lines.append(f"\n**Channel {ch['ch']}:**\n")
-            lines.append(f"- Probe: {ch['probe']}\n")
-            lines.append(f"- Scale: {ch['scale']}\n")
-            lines.append(f"- Coupling: {ch['coupling']}\n")
+            write(f"\n**Channel {ch['ch']}:**\n")
+            write(f"- Probe: {ch['probe']}\n")
+            write(f"- Scale: {ch['scale']}\n")
+            write(f"- Coupling: {ch['coupling']}\n")
         
         if scope.get('expected_waveform'):
             wf = scope['expected_waveform']
-            lines.append(f"\n**Expected Waveform:**\n")
-            lines.append(f"- Frequency: {wf['frequency_hz']} Hz\n")
-            lines.append(f"- Period: {wf['period_ms']} ms\n")
-            lines.append(f"- Duty Cycle: {wf['duty_cycle_pct']}%\n")
+            write(f"\n**Expected Waveform:**\n")
+            write(f"- Frequency: {wf['frequency_hz']} Hz\n")
+            write(f"- Period: {wf['period_ms']} ms\n")
+            write(f"- Duty Cycle: {wf['duty_cycle_pct']}%\n")
     
     # Notes
     if report.get('notes'):
-        lines.append("\n## Additional Notes\n")
+        write("\n## Additional Notes\n")
         for note in report['notes']:
-            lines.append(f"- {note}\n")
-    
-    # Write to file
-    Path(output_path).write_text(''.join(lines), encoding='utf-8')
+            write(f"- {note}\n")
 
 
 def export_checklist_json(report: Dict[str, Any], output_path: str) -> None:
     """Export full report to JSON format"""
-    Path(output_path).write_text(
-        json.dumps(report, indent=2, ensure_ascii=False),
-        encoding='utf-8'
-    )
\ No newline at end of file
+    with _atomic_output(output_path) as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
\ No newline at end of file
@@ -1,8 +1,9 @@
 #src/findings_enhanced.py
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
-from src.netlist_build import NetBuildResult
+from src.netlist_build import NetBuildResult, pos_key
 from src.kicad_extract import Schematic
+from src.index import PointGrid, symbol_grid, symbols_of_kind
 
 @dataclass
 class Finding:
@@ -15,26 +16,52 @@ class Finding:
     prevents_bringup: bool = False
     schematic_location: Optional[str] = None
 
+def _power_labels(sch: Schematic, power_nets: List[str]) -> List[Any]:
+    """
+    Labels naming one of `power_nets`, in schematic order. The same pass over
+    sch.labels also collects the OUT labels for _output_labels(); both are
+    cached on the schematic.
+    """
+    key = frozenset(power_nets)
+    cached = getattr(sch, "_power_labels", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    power, output = [], []
+    for l in sch.labels:
+        if l.text in key:
+            power.append(l)
+        if 'OUT' in l.text.upper():
+            output.append(l)
+    sch._power_labels = (key, power)
+    sch._output_labels = output
+    return power
+
+def _output_labels(sch: Schematic) -> List[Any]:
+    """Labels whose text contains OUT, in schematic order, cached on the schematic"""
+    labels = getattr(sch, "_output_labels", None)
+    if labels is None:
+        labels = sch._output_labels = [l for l in sch.labels if 'OUT' in l.text.upper()]
+    return labels
+
 def analyze_power_connectivity(sch: Schematic, net_build: NetBuildResult, power_nets: List[str]) -> List[Finding]:
     """Analyze power distribution issues"""
     findings = []
     
     # Check if power labels are actually connected
-    power_labels = [l for l in sch.labels if l.text in power_nets]
+    power_labels = _power_labels(sch, power_nets)
+    attached = net_build.label_attached_keys
     
     for label in power_labels:
         if not label.at:
             continue
             
         # Check if label position is in label_attached mapping
-        is_connected = label.at in net_build.label_attached
+        is_connected = pos_key(label.at) in attached
         
         if not is_connected:
             # Try to identify what this power net should connect to
-            nearby_symbols = [s for s in sch.symbols 
-                            if s.at and label.at and 
-                            abs(s.at[0] - label.at[0]) < 50 and 
-                            abs(s.at[1] - label.at[1]) < 50]
+            nearby_symbols = [sch.symbols[i]
+                              for i in sorted(symbol_grid(sch).in_box(label.at, 50, strict=True))]
             
             location_hint = ""
             if nearby_symbols:
@@ -65,7 +92,13 @@ def analyze_ic_power_pins(sch: Schematic, net_build: NetBuildResult, power_nets:
     findings = []
     
     # Find all ICs (components starting with U)
-    ics = [s for s in sch.symbols if s.ref.startswith('U') and '?' not in s.ref]
+    ics = [s for s in symbols_of_kind(sch, 'U') if '?' not in s.ref]
+    
+    # Bucket power label positions once instead of rescanning every label per IC
+    label_grid = PointGrid(100)
+    for l in _power_labels(sch, power_nets):
+        if l.at:
+            label_grid.add(l.at, None)
     
     for ic in ics:
         # Simplified check - in production, would parse actual pin connections
@@ -74,14 +107,7 @@ def analyze_ic_power_pins(sch: Schematic, net_build: NetBuildResult, power_nets:
         if not ic.at:
             continue
         
-        nearby_power_labels = [
-            l for l in sch.labels 
-            if l.text in power_nets and l.at and
-            abs(l.at[0] - ic.at[0]) < 100 and 
-            abs(l.at[1] - ic.at[1]) < 100
-        ]
-        
-        if not nearby_power_labels:
+        if not label_grid.any_in_box(ic.at, 100, strict=True):
             findings.append(Finding(
                 id="ic_missing_power_connection",
                 severity="high",
@@ -107,13 +133,14 @@ def analyze_critical_signal_paths(sch: Schematic, net_build: NetBuildResult) ->
     findings = []
     
     # Check for floating output signals
-    output_labels = [l for l in sch.labels if 'OUT' in l.text.upper()]
+    output_labels = _output_labels(sch)
+    attached = net_build.label_attached_keys
     
     for label in output_labels:
         if not label.at:
             continue
             
-        is_connected = label.at in net_build.label_attached
+        is_connected = pos_key(label.at) in attached
         
         if not is_connected:
             findings.append(Finding(
@@ -188,21 +215,20 @@ def analyze_findings(net_build: NetBuildResult, sch: Schematic = None, power_net
     
     # D) Check for potential ERC violations
     # Look for nets with only one connection (likely broken)
-    for net in net_build.nets:
-        if len(net.nodes) == 1 and not net.name.startswith("NET_UNNAMED"):
-            findings.append(Finding(
-                id="single_node_net",
-                severity="medium",
-                summary=f'Net "{net.name}" has only one connection point',
-                why="A net with only one node is likely incomplete - signals need at least a source and destination.",
-                evidence={
-                    "net": net.name,
-                    "node_count": len(net.nodes),
-                    "position": list(net.nodes)[0] if net.nodes else None
-                },
-                fix_suggestion=f"Verify {net.name} connects to both its source and destination. "
-                              "Check for missing wires or disconnected pins.",
-                prevents_bringup=False
-            ))
+    for net in net_build.singleton_nets:
+        findings.append(Finding(
+            id="single_node_net",
+            severity="medium",
+            summary=f'Net "{net.name}" has only one connection point',
+            why="A net with only one node is likely incomplete - signals need at least a source and destination.",
+            evidence={
+                "net": net.name,
+                "node_count": len(net.nodes),
+                "position": next(iter(net.nodes))
+            },
+            fix_suggestion=f"Verify {net.name} connects to both its source and destination. "
+                          "Check for missing wires or disconnected pins.",
+            prevents_bringup=False
+        ))
     
     return findings
\ No newline at end of file
@@ -0,0 +1,132 @@
+# src/index.py
+"""
+Schematic lookup tables shared by the extraction/reporting modules and the
+analysis package: ref-prefix symbol buckets, the ref index and a uniform
+grid for fixed-radius/box position queries. Tables are built once and
+cached on the Schematic they index.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+from src.kicad_extract import Point
+
+
+def _scan_symbols(sch) -> None:
+    """
+    Single pass over sch.symbols filling the ref index and the all/placed
+    symbol buckets (keyed by the first letter of the ref).
+    """
+    ref_index: Dict[str, object] = {}
+    all_by_kind: Dict[str, List[object]] = {}
+    by_kind: Dict[str, List[object]] = {}
+    for sym in sch.symbols:
+        ref_index.setdefault(sym.ref, sym)
+        if sym.ref:
+            all_by_kind.setdefault(sym.ref[0], []).append(sym)
+            if sym.at:
+                by_kind.setdefault(sym.ref[0], []).append(sym)
+    sch._ref_index = ref_index
+    sch._all_by_kind = all_by_kind
+    sch._by_kind = by_kind
+
+
+def symbols_by_ref(sch) -> Dict[str, object]:
+    """ref -> symbol. The first symbol wins on duplicate refs, like a linear scan would."""
+    if getattr(sch, "_ref_index", None) is None:
+        _scan_symbols(sch)
+    return sch._ref_index
+
+
+def symbols_of_kind(sch, prefix: str) -> List[object]:
+    """Symbols, placed or not, whose ref starts with `prefix`, in schematic order"""
+    if getattr(sch, "_all_by_kind", None) is None:
+        _scan_symbols(sch)
+    syms = sch._all_by_kind.get(prefix[0], [])
+    if len(prefix) > 1:
+        syms = [s for s in syms if s.ref.startswith(prefix)]
+    return syms
+
+
+def placed_symbols(sch, prefix: str) -> List[object]:
+    """Symbols with a position whose ref starts with `prefix` (e.g. "R", "C", "U"), in schematic order"""
+    if getattr(sch, "_by_kind", None) is None:
+        _scan_symbols(sch)
+    syms = sch._by_kind.get(prefix[0], [])
+    if len(prefix) > 1:
+        syms = [s for s in syms if s.ref.startswith(prefix)]
+    return syms
+
+
+class PointGrid:
+    """Uniform grid bucketing of points for fixed-radius neighbour queries"""
+
+    def __init__(self, cell: int):
+        self.cell = cell
+        self._buckets: Dict[Point, List[Tuple[Any, int, int]]] = defaultdict(list)
+
+    def add(self, at: Point, item: Any) -> None:
+        x, y = at
+        self._buckets[(x // self.cell, y // self.cell)].append((item, x, y))
+
+    def near(self, at: Point, radius: float) -> Iterator[Any]:
+        """Yield items strictly closer than `radius` to `at`"""
+        x, y = at
+        cx, cy = int(x // self.cell), int(y // self.cell)
+        reach = int(-(-radius // self.cell))
+        r2 = radius * radius
+        buckets = self._buckets
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                bucket = buckets.get((gx, gy))
+                if not bucket:
+                    continue
+                for item, px, py in bucket:
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy < r2:
+                        yield item
+
+    def in_box(self, at: Point, half: float, strict: bool = False) -> Iterator[Any]:
+        """Yield items within `half` of `at` on both axes (inclusive unless strict)"""
+        x, y = at
+        cell = self.cell
+        cx, cy = int(x // cell), int(y // cell)
+        reach = int(-(-half // cell))
+        # Cells at offset k on both axes lie entirely inside the box when (|k| + 1) * cell <= half
+        inner = int(half // cell) - 1
+        buckets = self._buckets
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                bucket = buckets.get((gx, gy))
+                if not bucket:
+                    continue
+                if abs(gx - cx) <= inner and abs(gy - cy) <= inner:
+                    for item, _, _ in bucket:
+                        yield item
+                    continue
+                for item, px, py in bucket:
+                    dx = abs(px - x)
+                    dy = abs(py - y)
+                    if (dx < half and dy < half) if strict else (dx <= half and dy <= half):
+                        yield item
+
+    def any_in_box(self, at: Point, half: float, strict: bool = False) -> bool:
+        """Whether any point lies within `half` of `at` on both axes (inclusive unless strict)"""
+        for _ in self.in_box(at, half, strict):
+            return True
+        return False
+
+
+def symbol_grid(sch, cell: int = 50) -> PointGrid:
+    """
+    Grid of every symbol with a position, items are indices into sch.symbols.
+    Built once per schematic and cached on it.
+    """
+    grid = getattr(sch, "_symbol_grid", None)
+    if grid is None or grid.cell != cell:
+        grid = PointGrid(cell)
+        for i, sym in enumerate(sch.symbols):
+            if sym.at:
+                grid.add(sym.at, i)
+        sch._symbol_grid = grid
+    return grid
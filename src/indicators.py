@@ -6,27 +6,31 @@ from typing import Dict, List, Optional
 from src.netlist_build import Net
 from src.kicad_extract import Schematic, SchSymbol
 
+# Net name patterns are matched against upper-cased names, so they carry no
+# IGNORECASE flag. POWER_NAME_RE is used with fullmatch().
 POWER_NAME_RE = re.compile(
-    r"^(?:"
     r"GND|AGND|DGND|VSS|"
     r"VBAT|VIN|VCC|"
     r"VDD(?:[A-Z0-9_]+)?|AVDD|DVDD|"
     r"VREF(?:[A-Z0-9_]+)?|"
     r"PWR|POWER|"
     r"\+?\d+(?:\.\d+)?V"          # matches +5V, 5V, 1.8V, 12V
-    r")$",
-    re.IGNORECASE
 )
 
-RESET_RE = re.compile(r"(RST|RESET|NRST)\b", re.IGNORECASE)
-CLOCK_NET_RE = re.compile(r"(HSE|LSE|XTAL|OSC|CLK|MCO)\b", re.IGNORECASE)
+RESET_RE = re.compile(r"(RST|RESET|NRST)\b")
+CLOCK_NET_RE = re.compile(r"(HSE|LSE|XTAL|OSC|CLK|MCO)\b")
 
-SWD_RE = re.compile(r"\b(SWDIO|SWCLK|SWO)\b", re.IGNORECASE)
-JTAG_RE = re.compile(r"\b(TMS|TCK|TDI|TDO|TRST)\b", re.IGNORECASE)
-UART_RE = re.compile(r"\b(TX|RX|UART)\b", re.IGNORECASE)
+SWD_RE = re.compile(r"\b(SWDIO|SWCLK|SWO)\b")
+JTAG_RE = re.compile(r"\b(TMS|TCK|TDI|TDO|TRST)\b")
+UART_RE = re.compile(r"\b(TX|RX|UART)\b")
 
 CRYSTAL_RE = re.compile(r"(crystal|xtal|oscillator)", re.IGNORECASE)
 
+# Reference designator letters of crystals/oscillators
+_CLOCK_REF_PREFIXES = frozenset({"X", "Y"})
+
+MCU_HINT_RE = re.compile(r"(stm32|esp32|nrf|atmega|attiny|rp2040|pic|msp430|samd|imx|kinetis|gd32)", re.IGNORECASE)
+
 @dataclass
 class Detected:
     power_nets: List[str]
@@ -38,46 +42,57 @@ class Detected:
     notes: List[str]
 
 def detect_nets(nets: List[Net]) -> Dict[str, List[str]]:
+    # Classify each distinct name once; a name can land in more than one bucket
     power, reset, clock = [], [], []
-    for n in nets:
-        name = n.name.strip()
-        if POWER_NAME_RE.match(name):
+    for name in {n.name.strip() for n in nets}:
+        upper = name.upper()
+        if POWER_NAME_RE.fullmatch(upper):
             power.append(name)
-        if RESET_RE.search(name):
+        if RESET_RE.search(upper):
             reset.append(name)
-        if CLOCK_NET_RE.search(name):
+        if CLOCK_NET_RE.search(upper):
             clock.append(name)
-    return {"power": sorted(set(power)), "reset": sorted(set(reset)), "clock": sorted(set(clock))}
+    return {"power": sorted(power), "reset": sorted(reset), "clock": sorted(clock)}
+
+def _search_blob(s: SchSymbol) -> str:
+    """ref, value, lib_id and properties as one string for hint searches, cached on the symbol"""
+    blob = getattr(s, "_search_blob", None)
+    if blob is None:
+        blob = s._search_blob = f"{s.ref} {s.value} {s.lib_id} " + " ".join([f"{k}:{v}" for k, v in s.properties.items()])
+    return blob
 
 def detect_mcu(symbols: List[SchSymbol]) -> List[str]:
     # Heuristic: reference starts with U and value/lib contains common MCU hints
-    mcu_hints = re.compile(r"(stm32|esp32|nrf|atmega|attiny|rp2040|pic|msp430|samd|imx|kinetis|gd32)", re.IGNORECASE)
-    out = []
+    out = set()
     for s in symbols:
-        if "?" in s.ref:
+        if "?" in s.ref or s.ref[:1].upper() != "U":
             continue
-        blob = f"{s.ref} {s.value} {s.lib_id} " + " ".join([f"{k}:{v}" for k, v in s.properties.items()])
-        if s.ref.upper().startswith("U") and mcu_hints.search(blob):
-            out.append(s.ref)
-    return sorted(set(out))
+        if MCU_HINT_RE.search(_search_blob(s)):
+            out.add(s.ref)
+    return sorted(out)
 
 def detect_clock_sources(symbols: List[SchSymbol]) -> List[str]:
-    out = []
+    out = set()
     for s in symbols:
-        blob = f"{s.value} {s.lib_id}"
-        if CRYSTAL_RE.search(blob) or s.ref.upper().startswith(("Y", "X")):
-            out.append(s.ref)
-    return sorted(set(out))
+        if s.ref in out:
+            continue
+        if s.ref[:1].upper() in _CLOCK_REF_PREFIXES or CRYSTAL_RE.search(f"{s.value} {s.lib_id}"):
+            out.add(s.ref)
+    return sorted(out)
 
 def detect_debug_ifaces(nets: List[Net]) -> List[str]:
-    names = [n.name for n in nets]
-    if any(SWD_RE.search(x) for x in names):
-        return ["SWD"]
-    if any(JTAG_RE.search(x) for x in names):
-        return ["JTAG"]
-    if any(UART_RE.search(x) for x in names):
-        return ["UART"]
-    return []
+    # One pass, keeping the best interface seen so far (SWD > JTAG > UART)
+    found = None
+    for n in nets:
+        name = n.name.upper()
+        if SWD_RE.search(name):
+            return ["SWD"]
+        if found != "JTAG":
+            if JTAG_RE.search(name):
+                found = "JTAG"
+            elif found is None and UART_RE.search(name):
+                found = "UART"
+    return [found] if found else []
 
 def run_detectors(sch: Schematic, nets: List[Net]) -> Detected:
     net_hits = detect_nets(nets)
@@ -35,15 +35,33 @@ class Schematic:
     wires: List[SchWire] = field(default_factory=list)
     junctions: List[SchJunction] = field(default_factory=list)
 
-def _find_all(node: Any, head: str) -> List[Any]:
-    out = []
-    if isinstance(node, list) and node:
-        if node[0] == head:
-            out.append(node)
-        for c in node[1:]:
-            out.extend(_find_all(c, head))
+# Node heads parse_schematic reads, collected in one walk of the tree
+_SCHEMATIC_HEADS = ("symbol", "label", "global_label", "hierarchical_label", "wire", "junction")
+
+def _collect(node: Any, heads: Tuple[str, ...]) -> Dict[str, List[Any]]:
+    """
+    Every list node whose head is in `heads`, bucketed by head in document order.
+    Iterative pre-order walk; matched nodes are still descended into.
+    """
+    out: Dict[str, List[Any]] = {h: [] for h in heads}
+    stack = [node]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        n = pop()
+        if isinstance(n, list) and n:
+            h = n[0]
+            if isinstance(h, str):
+                bucket = out.get(h)
+                if bucket is not None:
+                    bucket.append(n)
+            # Children reversed so they pop in document order
+            push(n[:0:-1])
     return out
 
+def _find_all(node: Any, head: str) -> List[Any]:
+    return _collect(node, (head,))[head]
+
 def _get_kv(props: List[Any]) -> Dict[str, str]:
     """
     KiCad properties appear like: (property "Reference" "U1" (...))
@@ -63,7 +81,8 @@ def parse_schematic(tree: list) -> Schematic:
     # First pass: Parse library symbols to get default pin configurations
     lib_pins = {} # "LibID": [ {name, number, at, type, shape} ]
     
-    all_symbols = _find_all(tree, "symbol")
+    nodes = _collect(tree, _SCHEMATIC_HEADS)
+    all_symbols = nodes["symbol"]
     
     # 1. Extract Library Definitions
     for sym in all_symbols:
@@ -140,7 +159,7 @@ def parse_schematic(tree: list) -> Schematic:
             
     # Labels (local/global)
     for head, kind in [("label", "label"), ("global_label", "global_label"), ("hierarchical_label", "hierarchical_label")]:
-        for lab in _find_all(tree, head):
+        for lab in nodes[head]:
             text = ""
             at = None
             for item in lab[1:]:
@@ -152,7 +171,7 @@ def parse_schematic(tree: list) -> Schematic:
                 sch.labels.append(SchLabel(text=text, at=at, kind=kind))
 
     # Wires
-    for w in _find_all(tree, "wire"):
+    for w in nodes["wire"]:
         pts = []
         for item in w[1:]:
             if isinstance(item, list) and item and item[0] == "pts":
@@ -164,7 +183,7 @@ def parse_schematic(tree: list) -> Schematic:
             sch.wires.append(SchWire(pts=pts))
 
     # Junctions
-    for j in _find_all(tree, "junction"):
+    for j in nodes["junction"]:
         at = None
         for item in j[1:]:
             if isinstance(item, list) and item and item[0] == "at" and len(item) >= 3:
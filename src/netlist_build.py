@@ -15,6 +15,25 @@ class NetBuildResult:
     nets: List[Net]
     label_attached: Dict[Tuple[int,int], str]    # label position -> net name
     label_unattached: List[Tuple[str, Tuple[int,int]]]  # (text, pos)
+    label_attached_keys: Optional[Set[int]] = None  # pos_key() of attached label positions, derived if not given
+    singleton_nets: Optional[List[Net]] = None  # named nets with a single node, derived if not given
+
+    def __post_init__(self):
+        if self.label_attached_keys is None:
+            self.label_attached_keys = {pos_key(at) for at in self.label_attached}
+        if self.singleton_nets is None:
+            self.singleton_nets = [
+                net for net in self.nets
+                if len(net.nodes) == 1 and not net.name.startswith("NET_UNNAMED")
+            ]
+
+
+def pos_key(at: Point) -> int:
+    """
+    Pack an integer grid position into a single int for cheap hashing.
+    Positions are already rounded to the grid by kicad_extract.
+    """
+    return (at[0] << 32) | (at[1] & 0xFFFFFFFF)
 
 
 def _neighbors_from_wires(wires) -> Dict[Point, Set[Point]]:
@@ -64,6 +83,7 @@ def build_nets(sch: Schematic, label_tolerance: int = 0) -> NetBuildResult:
     # Flood fill connected components
     visited: Set[Point] = set()
     nets: List[Net] = []
+    singleton_nets: List[Net] = []
     unnamed_count = 0
 
     for start in all_nodes:
@@ -147,6 +167,15 @@ def build_nets(sch: Schematic, label_tolerance: int = 0) -> NetBuildResult:
                 unnamed_count += 1
                 name = f"NET_UNNAMED_{unnamed_count}"
 
-        nets.append(Net(name=name, nodes=comp))
-
-    return NetBuildResult(nets=nets, label_attached=label_attached, label_unattached=label_unattached)
+        net = Net(name=name, nodes=comp)
+        nets.append(net)
+        if len(comp) == 1 and not name.startswith("NET_UNNAMED"):
+            singleton_nets.append(net)
+
+    return NetBuildResult(
+        nets=nets,
+        label_attached=label_attached,
+        label_unattached=label_unattached,
+        label_attached_keys={pos_key(at) for at in label_attached},
+        singleton_nets=singleton_nets,
+    )
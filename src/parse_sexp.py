@@ -1,14 +1,17 @@
 #src/parse_sexp.py
 from __future__ import annotations
+import sys
 from pathlib import Path
 from sexpdata import loads, Symbol
 
 def _normalize(obj):
     """
     Convert sexpdata's Symbol to plain string, and recursively normalize lists.
+    Symbol names (node heads like "at", "property", "pin") are interned, so the
+    many repeats share one string and compare by identity in kicad_extract.
     """
     if isinstance(obj, Symbol):
-        return str(obj)
+        return sys.intern(str(obj))
     if isinstance(obj, list):
         return [_normalize(x) for x in obj]
     return obj
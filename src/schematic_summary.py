@@ -55,15 +55,16 @@ def generate_schematic_summary(sch: Schematic, net_build: NetBuildResult) -> Dic
     # 3. Label connectivity status (critical for finding floating labels)
     labels_info = []
     for label in sch.labels:
+        net_name = net_build.label_attached.get(label.at) if label.at else None
         label_info = {
             "text": label.text,
             "type": label.kind,
-            "connected": label.at in net_build.label_attached if label.at else False,
+            "connected": net_name is not None,
             "position": {"x": label.at[0], "y": label.at[1]} if label.at else None
         }
         
-        if label.at and label.at in net_build.label_attached:
-            label_info["net_name"] = net_build.label_attached[label.at]
+        if net_name is not None:
+            label_info["net_name"] = net_name
         
         labels_info.append(label_info)
     
@@ -120,12 +121,26 @@ def generate_schematic_summary(sch: Schematic, net_build: NetBuildResult) -> Dic
     }
 
 
+# Single-letter reference prefixes that fully determine the component type
+_REF_PREFIX_TYPES = {
+    'R': "resistor",
+    'C': "capacitor",
+    'L': "inductor",
+    'D': "diode",
+    'Q': "transistor",
+    'Y': "crystal_oscillator",
+    'X': "crystal_oscillator",
+    'J': "connector",
+}
+
+
 def _classify_component(ref: str, lib_id: str) -> str:
     """Classify component type from reference and library ID"""
     ref_upper = ref.upper()
+    kind = ref_upper[:1]
     lib_lower = lib_id.lower()
     
-    if ref_upper.startswith('U'):
+    if kind == 'U':
         if any(kw in lib_lower for kw in ['555', 'timer']):
             return "timer_ic"
         elif any(kw in lib_lower for kw in ['stm32', 'esp32', 'atmega', 'pic', 'mcu']):
@@ -136,20 +151,8 @@ def _classify_component(ref: str, lib_id: str) -> str:
             return "opamp"
         else:
             return "ic"
-    elif ref_upper.startswith('R'):
-        return "resistor"
-    elif ref_upper.startswith('C'):
-        return "capacitor"
-    elif ref_upper.startswith('L'):
-        return "inductor"
-    elif ref_upper.startswith('D'):
-        return "diode"
-    elif ref_upper.startswith('Q'):
-        return "transistor"
-    elif ref_upper.startswith(('Y', 'X')):
-        return "crystal_oscillator"
-    elif ref_upper.startswith('J'):
-        return "connector"
+    elif kind in _REF_PREFIX_TYPES:
+        return _REF_PREFIX_TYPES[kind]
     elif ref_upper.startswith('SW'):
         return "switch"
     elif ref_upper.startswith('LED'):
@@ -167,6 +170,7 @@ def _build_proximity_map(components: List[Dict]) -> Dict[str, List[str]]:
     """
     proximity_map = {}
     PROXIMITY_THRESHOLD = 50
+    threshold_sq = PROXIMITY_THRESHOLD * PROXIMITY_THRESHOLD
     
     for comp in components:
         if 'position' not in comp:
@@ -179,10 +183,12 @@ def _build_proximity_map(components: List[Dict]) -> Dict[str, List[str]]:
             if other['ref'] == comp['ref'] or 'position' not in other:
                 continue
             
+            # Compare squared distances, no sqrt needed for a threshold test
             other_x, other_y = other['position']['x'], other['position']['y']
-            distance = ((comp_x - other_x)**2 + (comp_y - comp_y)**2)**0.5
+            dx = comp_x - other_x
+            dy = comp_y - other_y
             
-            if distance < PROXIMITY_THRESHOLD:
+            if dx * dx + dy * dy < threshold_sq:
                 nearby.append(other['ref'])
         
         if nearby:
@@ -0,0 +1,111 @@
+"""
+Tests for the cross-call caches: the analysis result memo and the
+PointGrid box query the spatial caches are built on.
+
+Run from the repository root: python -m unittest discover -s tests -t .
+"""
+import copy
+import unittest
+
+from src.analysis import execute_analysis_function
+from src.index import PointGrid
+from src.kicad_extract import Schematic
+from src.netlist_build import Net, NetBuildResult
+
+
+def _netlist():
+    nets = [
+        Net(name="SDA", nodes={(0, 0), (10, 0)}),
+        Net(name="SCL", nodes={(0, 10), (10, 10)}),
+    ]
+    return Schematic(), NetBuildResult(nets=nets, label_attached={}, label_unattached=[])
+
+
+class ResultMemoTest(unittest.TestCase):
+    PARAMS = {"nets": ["SDA", "SCL"], "pull_type": "up"}
+
+    def test_hit_is_equal_but_independent(self):
+        sch, net_build = _netlist()
+        first = execute_analysis_function("verify_pull_up_pull_down", self.PARAMS, sch, net_build)
+        expected = copy.deepcopy(first)
+
+        # Mutate everything a report builder could touch, nested details included
+        first.details["SDA"]["checked"] = True
+        first.details["NEW"] = {}
+        first.issues.append("added by caller")
+        first.recommendations.clear()
+
+        hit = execute_analysis_function("verify_pull_up_pull_down", self.PARAMS, sch, net_build)
+        self.assertEqual(hit, expected)
+        self.assertIsNot(hit, first)
+
+        hit.details["SCL"]["checked"] = True
+        again = execute_analysis_function("verify_pull_up_pull_down", self.PARAMS, sch, net_build)
+        self.assertEqual(again, expected)
+        self.assertIsNot(again.details["SCL"], hit.details["SCL"])
+
+    def test_alias_shares_the_memo(self):
+        sch, net_build = _netlist()
+        direct = execute_analysis_function("verify_mcu_boot_configuration", {}, sch, net_build)
+        alias = execute_analysis_function("check_mcu_boot_pins", {}, sch, net_build)
+        self.assertEqual(alias, direct)
+
+    def test_params_of_different_types_do_not_share_a_result(self):
+        sch, net_build = _netlist()
+        as_int = execute_analysis_function(
+            "verify_pull_up_pull_down", {"nets": ["SDA"], "resistor_range": [1000, 100000]}, sch, net_build)
+        as_float = execute_analysis_function(
+            "verify_pull_up_pull_down", {"nets": ["SDA"], "resistor_range": [1000.0, 100000.0]}, sch, net_build)
+        as_tuple = execute_analysis_function(
+            "verify_pull_up_pull_down", {"nets": ["SDA"], "resistor_range": (2200, 4700)}, sch, net_build)
+        self.assertIs(type(as_int.details["SDA"]["resistance_range"][0]), int)
+        self.assertIs(type(as_float.details["SDA"]["resistance_range"][0]), float)
+        self.assertEqual(as_tuple.details["SDA"]["resistance_range"], (2200, 4700))
+
+
+def _brute_in_box(points, at, half, strict):
+    x, y = at
+    hits = []
+    for i, (px, py) in enumerate(points):
+        dx, dy = abs(px - x), abs(py - y)
+        if (dx < half and dy < half) if strict else (dx <= half and dy <= half):
+            hits.append(i)
+    return hits
+
+
+class PointGridInBoxTest(unittest.TestCase):
+    def _check(self, cell, half, points, queries):
+        grid = PointGrid(cell)
+        for i, p in enumerate(points):
+            grid.add(p, i)
+        for at in queries:
+            for strict in (True, False):
+                with self.subTest(cell=cell, half=half, at=at, strict=strict):
+                    self.assertEqual(sorted(grid.in_box(at, half, strict=strict)),
+                                     _brute_in_box(points, at, half, strict))
+                    self.assertEqual(grid.any_in_box(at, half, strict=strict),
+                                     bool(_brute_in_box(points, at, half, strict)))
+
+    def test_matches_brute_force_at_cell_boundaries(self):
+        for cell in (1, 3, 25, 50, 100):
+            for half in (3, 25, 50, 100):
+                # Points on and either side of every cell edge and box edge
+                offsets = sorted({k * cell + d for k in range(-3, 4) for d in (-1, 0, 1)}
+                                 | {s * half + d for s in (-1, 1) for d in (-1, 0, 1)})
+                points = [(ox, oy) for ox in offsets for oy in (0, half, -half, cell)]
+                queries = [(0, 0), (cell, cell), (cell - 1, 0), (-cell, half), (half, -half)]
+                self._check(cell, half, points, queries)
+
+    def test_float_positions_and_fractional_half(self):
+        points = [(49.5, 0), (50.0, 0), (50.5, 0), (-37.5, 37.5), (12.25, -12.75)]
+        self._check(50, 50, points, [(0, 0), (0.5, 0), (-0.5, 0.25)])
+        self._check(25, 37.5, points, [(0, 0), (-75, 0), (12.5, 0)])
+
+    def test_empty_grid(self):
+        grid = PointGrid(10)
+        self.assertEqual(list(grid.in_box((0, 0), 10)), [])
+        self.assertFalse(grid.any_in_box((0, 0), 10, strict=True))
+
+
+if __name__ == "__main__":
+    unittest.main()